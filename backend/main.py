@@ -6,23 +6,42 @@ human-in-the-loop clarifications, and comprehensive audit trails.
 """
 
 import asyncio
+import atexit
+import bisect
+import hashlib
 import logging
+import logging.handlers
 import json
+import queue
+import re
+import time
 import uuid
+from dataclasses import asdict, dataclass, fields as dataclass_fields, replace
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any
+from collections import defaultdict
+from typing import AsyncIterator, Dict, List, Optional, Any, Set, Tuple
 from contextlib import asynccontextmanager
+from itertools import islice
 
 from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect, Depends, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 from pydantic import BaseModel, Field
+from cachetools import TLRUCache
+from starlette.websockets import WebSocketState
+import aiohttp
+import msgspec
+import orjson
+import redis.asyncio as aioredis
+from arq import ArqRedis, create_pool
+from arq.connections import RedisSettings
 import uvicorn
 
 # Import our comprehensive Portia components
 import sys
 import os
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'code'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'portia_core'))
 
 from portia_core import (
     PortiaCore, AuditManager, DetectiveAgentType, VerificationStatus,
@@ -30,10 +49,10 @@ from portia_core import (
 )
 from clarification_system import (
     ClarificationManager, ClarificationRequest, ClarificationResponse,
-    ClarificationType, ClarificationPriority, ConfidenceMetrics
+    ClarificationType, ClarificationPriority, ClarificationStatus, ConfidenceMetrics
 )
 from web_retrieval_pipeline import (
-    WebRetrievalOrchestrator, CrawlJob, SearchStrategy, EvidenceItem
+    WebRetrievalOrchestrator, CrawlJob, SearchStrategy, EvidenceItem, create_http_session
 )
 from agents_example import ClaimParserAgent, EvidenceCollectorAgent
 
@@ -41,6 +60,349 @@ from agents_example import ClaimParserAgent, EvidenceCollectorAgent
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Hand log records to a listener thread so handler I/O never runs on the event loop
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, *logging.getLogger().handlers, respect_handler_level=True
+)
+logging.getLogger().handlers = [logging.handlers.QueueHandler(_log_queue)]
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+# Workflow entries expire after an hour of inactivity
+WORKFLOW_TTL_SECONDS = 3600
+
+# Completed workflows stay readable for ten minutes
+COMPLETED_WORKFLOW_TTL_SECONDS = 600
+
+# Upper bound on workflows tracked per process
+MAX_TRACKED_ENTRIES = 10_000
+
+# Interval between WebSocket liveness checks
+WEBSOCKET_HEARTBEAT_SECONDS = 30
+
+# Completed reports are reused for repeat submissions of the same claim for six hours
+RESULT_CACHE_TTL_SECONDS = 6 * 3600
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def claim_fingerprint(claim_text: str) -> str:
+    """Stable fingerprint of a claim, ignoring case, punctuation and spacing"""
+    normalized = " ".join(_WORD_RE.findall(claim_text.casefold()))
+    return hashlib.sha256(normalized.encode()).hexdigest()
+
+
+def result_cache_key(fingerprint: str) -> str:
+    """Store key holding the cached final report for a claim fingerprint"""
+    return f"claimcache:{fingerprint}"
+
+
+def inflight_key(fingerprint: str) -> str:
+    """Store key naming the claim currently processing a claim fingerprint"""
+    return f"inflight:{fingerprint}"
+
+
+# Progress messages only need coarse timestamps, so the ISO string is reused for 100ms
+_TIMESTAMP_RESOLUTION_SECONDS = 0.1
+_timestamp_cache = ["", 0.0]
+
+
+def fast_iso_now() -> str:
+    """Current UTC time as an ISO string, cached at 100ms resolution"""
+    now = time.time()
+    if now - _timestamp_cache[1] >= _TIMESTAMP_RESOLUTION_SECONDS:
+        _timestamp_cache[:] = [datetime.fromtimestamp(now, timezone.utc).isoformat(), now]
+    return _timestamp_cache[0]
+
+
+def _json_default(obj: Any) -> Any:
+    """Fallback encoder for values orjson cannot serialize natively"""
+    if hasattr(obj, "to_dict"):
+        return obj.to_dict()
+    return str(obj)
+
+
+class WorkflowStore:
+    """In-process workflow state store, used when Redis is not configured
+    
+    Field values are kept orjson-encoded so both stores hand back the same
+    plain JSON structures regardless of backend.
+    """
+    
+    def __init__(self, ttl_seconds: int = WORKFLOW_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        # Entries are (ttl, fields) so expire() can shorten one entry's lifetime
+        self._workflows: TLRUCache = TLRUCache(
+            maxsize=MAX_TRACKED_ENTRIES, ttu=lambda _key, entry, now: now + entry[0]
+        )
+        self._values: Dict[str, Tuple[float, bytes]] = {}
+        self._logs: Dict[str, Tuple[float, bytearray]] = {}
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = defaultdict(set)
+    
+    @staticmethod
+    def _encode(fields: Dict[str, Any]) -> Dict[str, bytes]:
+        return {key: orjson.dumps(value, default=_json_default) for key, value in fields.items()}
+    
+    @staticmethod
+    def _decode(raw: Dict[str, Any]) -> Dict[str, Any]:
+        return {key: orjson.loads(value) for key, value in raw.items()}
+    
+    async def create(self, claim_id: str, fields: Dict[str, Any]):
+        """Create the workflow entry for a claim"""
+        self._workflows[claim_id] = (self.ttl_seconds, self._encode(fields))
+    
+    async def update(self, claim_id: str, **fields: Any):
+        """Overwrite the given fields of a workflow entry"""
+        entry = self._workflows.get(claim_id)
+        if entry is not None:
+            workflow = entry[1]
+            workflow.update(self._encode(fields))
+            # Reassign to refresh the entry's TTL, matching the Redis store
+            self._workflows[claim_id] = (self.ttl_seconds, workflow)
+    
+    async def expire(self, claim_id: str, ttl_seconds: int):
+        """Drop a workflow entry after ttl_seconds"""
+        entry = self._workflows.get(claim_id)
+        if entry is not None:
+            self._workflows[claim_id] = (ttl_seconds, entry[1])
+    
+    async def get(self, claim_id: str, *fields: str) -> Optional[Dict[str, Any]]:
+        """Get a workflow entry, optionally restricted to the given fields"""
+        raw = await self.get_raw(claim_id, *fields)
+        return self._decode(raw) if raw is not None else None
+    
+    async def get_raw(self, claim_id: str, *fields: str) -> Optional[Dict[str, bytes]]:
+        """Get a workflow entry with its field values still JSON-encoded"""
+        entry = self._workflows.get(claim_id)
+        if entry is None:
+            return None
+        workflow = entry[1]
+        if fields:
+            workflow = {key: workflow[key] for key in fields if key in workflow}
+        return dict(workflow)
+    
+    async def get_value(self, key: str) -> Optional[Any]:
+        """Get a standalone cached value"""
+        entry = self._values.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._values[key]
+            return None
+        return orjson.loads(value)
+    
+    async def set_value(self, key: str, value: Any, ttl_seconds: int):
+        """Store a standalone value that expires after ttl_seconds"""
+        self._values[key] = (time.monotonic() + ttl_seconds, orjson.dumps(value, default=_json_default))
+    
+    async def set_value_if_absent(self, key: str, value: Any, ttl_seconds: int) -> Optional[Any]:
+        """Store a value unless the key is already set, returning the existing value if so"""
+        existing = await self.get_value(key)
+        if existing is not None:
+            return existing
+        await self.set_value(key, value, ttl_seconds)
+        return None
+    
+    async def delete_value(self, key: str):
+        """Remove a standalone value"""
+        self._values.pop(key, None)
+    
+    async def append_log(self, key: str, chunk: bytes, ttl_seconds: int):
+        """Append bytes to a log that expires ttl_seconds after its last write"""
+        entry = self._logs.get(key)
+        log = entry[1] if entry is not None and entry[0] > time.monotonic() else bytearray()
+        log += chunk
+        self._logs[key] = (time.monotonic() + ttl_seconds, log)
+    
+    async def get_log(self, key: str) -> bytes:
+        """Get the contents of a log, empty when it does not exist"""
+        entry = self._logs.get(key)
+        if entry is None:
+            return b""
+        expires_at, log = entry
+        if expires_at <= time.monotonic():
+            del self._logs[key]
+            return b""
+        return bytes(log)
+    
+    async def publish(self, channel: str, message: Dict[str, Any]):
+        """Push a message to every subscriber of a channel"""
+        for queue in self._subscribers.get(channel, ()):
+            queue.put_nowait(message)
+    
+    @asynccontextmanager
+    async def subscribe(self, channel: str) -> AsyncIterator[asyncio.Queue]:
+        """Subscribe to a channel, yielding a queue that receives published messages"""
+        queue: asyncio.Queue = asyncio.Queue()
+        self._subscribers[channel].add(queue)
+        try:
+            yield queue
+        finally:
+            subscribers = self._subscribers.get(channel)
+            if subscribers is not None:
+                subscribers.discard(queue)
+                if not subscribers:
+                    del self._subscribers[channel]
+    
+    async def close(self):
+        """Release store resources"""
+        self._workflows.clear()
+        self._values.clear()
+        self._logs.clear()
+
+
+class RedisWorkflowStore(WorkflowStore):
+    """Redis-backed workflow state store shared by all API workers
+    
+    Each claim is a hash at ``wf:{claim_id}`` whose TTL is refreshed on every write.
+    """
+    
+    def __init__(self, redis: aioredis.Redis, ttl_seconds: int = WORKFLOW_TTL_SECONDS):
+        super().__init__(ttl_seconds)
+        self.redis = redis
+    
+    @staticmethod
+    def _key(claim_id: str) -> str:
+        return f"wf:{claim_id}"
+    
+    async def create(self, claim_id: str, fields: Dict[str, Any]):
+        key = self._key(claim_id)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.delete(key)
+            pipe.hset(key, mapping=self._encode(fields))
+            pipe.expire(key, self.ttl_seconds)
+            await pipe.execute()
+    
+    async def update(self, claim_id: str, **fields: Any):
+        key = self._key(claim_id)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.hset(key, mapping=self._encode(fields))
+            pipe.expire(key, self.ttl_seconds)
+            await pipe.execute()
+    
+    async def expire(self, claim_id: str, ttl_seconds: int):
+        await self.redis.expire(self._key(claim_id), ttl_seconds)
+    
+    async def get_raw(self, claim_id: str, *fields: str) -> Optional[Dict[str, bytes]]:
+        key = self._key(claim_id)
+        if fields:
+            # Single HMGET round trip instead of one HGET per field
+            values = await self.redis.hmget(key, fields)
+            raw = {field: value for field, value in zip(fields, values) if value is not None}
+        else:
+            raw = await self.redis.hgetall(key)
+        if not raw:
+            return None
+        return {
+            (field.decode() if isinstance(field, bytes) else field): value
+            for field, value in raw.items()
+        }
+    
+    async def get_value(self, key: str) -> Optional[Any]:
+        value = await self.redis.get(key)
+        return orjson.loads(value) if value is not None else None
+    
+    async def set_value(self, key: str, value: Any, ttl_seconds: int):
+        await self.redis.set(key, orjson.dumps(value, default=_json_default), ex=ttl_seconds)
+    
+    async def set_value_if_absent(self, key: str, value: Any, ttl_seconds: int) -> Optional[Any]:
+        # SET NX makes the check-and-claim atomic across workers
+        if await self.redis.set(key, orjson.dumps(value, default=_json_default), ex=ttl_seconds, nx=True):
+            return None
+        return await self.get_value(key)
+    
+    async def delete_value(self, key: str):
+        await self.redis.delete(key)
+    
+    async def append_log(self, key: str, chunk: bytes, ttl_seconds: int):
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.append(key, chunk)
+            pipe.expire(key, ttl_seconds)
+            await pipe.execute()
+    
+    async def get_log(self, key: str) -> bytes:
+        return await self.redis.get(key) or b""
+    
+    async def publish(self, channel: str, message: Dict[str, Any]):
+        await self.redis.publish(channel, orjson.dumps(message, default=_json_default))
+    
+    @asynccontextmanager
+    async def subscribe(self, channel: str) -> AsyncIterator[asyncio.Queue]:
+        queue: asyncio.Queue = asyncio.Queue()
+        pubsub = self.redis.pubsub()
+        await pubsub.subscribe(channel)
+        
+        async def forward():
+            async for item in pubsub.listen():
+                if item["type"] == "message":
+                    queue.put_nowait(orjson.loads(item["data"]))
+        
+        forwarder = asyncio.create_task(forward())
+        try:
+            yield queue
+        finally:
+            forwarder.cancel()
+            await pubsub.unsubscribe(channel)
+            await pubsub.aclose()
+    
+    async def close(self):
+        await self.redis.aclose()
+
+
+def updates_channel(claim_id: str) -> str:
+    """Pub/sub channel carrying progress updates for a claim"""
+    return f"wf:{claim_id}"
+
+
+def clarification_channel(request_id: str) -> str:
+    """Pub/sub channel signalling the response to a clarification request"""
+    return f"clarification:{request_id}"
+
+
+def clarification_request_key(request_id: str) -> str:
+    """Store key holding a pending clarification request"""
+    return f"clarification_request:{request_id}"
+
+
+def clarification_response_key(request_id: str) -> str:
+    """Store key holding the first response submitted for a clarification request"""
+    return f"clarification_response:{request_id}"
+
+
+def audit_trail_key(claim_id: str) -> str:
+    """Store key holding a claim's audit trail as newline-delimited JSON"""
+    return f"audit:{claim_id}"
+
+
+@dataclass(frozen=True, slots=True)
+class WorkflowSnapshot:
+    """Immutable progress view of a workflow, replaced and persisted as a whole on every transition"""
+    status: str
+    current_agent: Optional[str]
+    progress_percentage: float
+    
+    @classmethod
+    def from_workflow(cls, workflow: Dict[str, Any]) -> "WorkflowSnapshot":
+        return cls(
+            status=workflow["status"],
+            current_agent=workflow.get("current_agent"),
+            progress_percentage=workflow.get("progress_percentage", 0.0)
+        )
+
+
+_SNAPSHOT_FIELDS = tuple(f.name for f in dataclass_fields(WorkflowSnapshot))
+
+
+MAX_CONCURRENT_CRAWLS = 5
+EVIDENCE_STRATEGIES = (
+    SearchStrategy.BROAD_SEARCH,
+    SearchStrategy.NEWS_FOCUSED,
+    SearchStrategy.FACT_CHECK_FOCUSED,
+)
+
+
 # Global state management
 class ApplicationState:
     def __init__(self):
@@ -48,17 +410,28 @@ class ApplicationState:
         self.audit_manager = AuditManager()
         self.clarification_manager: Optional[ClarificationManager] = None
         self.web_orchestrator: Optional[WebRetrievalOrchestrator] = None
-        self.active_workflows: Dict[str, Dict] = {}
+        self.workflows: WorkflowStore = WorkflowStore()
+        self.task_queue: Optional[ArqRedis] = None
+        # Removed by the WebSocket handler itself when its connection ends
         self.websocket_connections: Dict[str, WebSocket] = {}
+        self.crawl_semaphore = asyncio.Semaphore(MAX_CONCURRENT_CRAWLS)
+        self.http_session: Optional[aiohttp.ClientSession] = None
+        self.config: Optional[PortiaConfig] = None
         
     async def initialize(self):
         """Initialize all Portia components"""
         try:
             # Initialize Portia configuration
-            config = PortiaConfig()
+            config = self.config = PortiaConfig()
             validation_errors = config.validate()
             if validation_errors:
-                logger.warning(f"Configuration issues: {validation_errors}")
+                logger.warning("Configuration issues: %s", validation_errors)
+            
+            # Share workflow state across workers through Redis when configured
+            if config.redis_url:
+                self.workflows = RedisWorkflowStore(aioredis.from_url(config.redis_url))
+            else:
+                logger.warning("REDIS_URL not set - workflow state is local to this process")
             
             # Initialize core Portia integration
             self.portia_core = await PortiaCore.create(
@@ -78,17 +451,50 @@ class ApplicationState:
                 }
             )
             
-            # Initialize web retrieval orchestrator
+            # Initialize web retrieval orchestrator on one pooled HTTP session
+            self.http_session = create_http_session()
             self.web_orchestrator = WebRetrievalOrchestrator(
-                max_concurrent_crawls=5,
-                rate_limit_delay=1.0
+                max_concurrent_crawls=MAX_CONCURRENT_CRAWLS,
+                rate_limit_delay=1.0,
+                session=self.http_session
             )
             
             logger.info("All Portia components initialized successfully")
             
         except Exception as e:
-            logger.error(f"Failed to initialize Portia components: {e}")
+            logger.error("Failed to initialize Portia components: %s", e)
             raise
+    
+    async def connect_task_queue(self):
+        """Connect to the ARQ queue so claim workflows run in dedicated worker processes"""
+        if self.config and self.config.redis_url:
+            self.task_queue = await create_pool(RedisSettings.from_dsn(self.config.redis_url))
+        else:
+            logger.warning("REDIS_URL not set - claim workflows will run inside the API process")
+    
+    async def prune_websocket_connections(self):
+        """Periodically ping tracked WebSockets and forget the ones that are gone"""
+        while True:
+            await asyncio.sleep(WEBSOCKET_HEARTBEAT_SECONDS)
+            for claim_id, websocket in list(self.websocket_connections.items()):
+                try:
+                    if websocket.client_state != WebSocketState.CONNECTED:
+                        raise ConnectionError("WebSocket no longer connected")
+                    await send_json_message(websocket, {"type": "heartbeat"})
+                except Exception as e:
+                    logger.info("Dropping stale WebSocket for claim %s: %s", claim_id, e)
+                    if self.websocket_connections.get(claim_id) is websocket:
+                        del self.websocket_connections[claim_id]
+    
+    async def shutdown(self):
+        """Release all component resources"""
+        if self.web_orchestrator:
+            await self.web_orchestrator.cleanup()
+        if self.http_session:
+            await self.http_session.close()
+        if self.task_queue:
+            await self.task_queue.aclose()
+        await self.workflows.close()
 
 app_state = ApplicationState()
 
@@ -97,16 +503,19 @@ async def lifespan(app: FastAPI):
     """Application lifespan management"""
     # Startup
     await app_state.initialize()
+    await app_state.connect_task_queue()
+    websocket_gc = asyncio.create_task(app_state.prune_websocket_connections())
     yield
+    websocket_gc.cancel()
     # Shutdown
-    if app_state.web_orchestrator:
-        await app_state.web_orchestrator.cleanup()
+    await app_state.shutdown()
 
 app = FastAPI(
     title="Crowd-Sourced AI Detective API",
     description="Comprehensive misinformation detection using Portia SDK multi-agent orchestration",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # CORS configuration
@@ -118,6 +527,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger JSON responses such as audit trails and status payloads
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Pydantic models for API
 class ClaimSubmission(BaseModel):
     claim_text: str = Field(..., min_length=10, description="The claim to be fact-checked")
@@ -126,15 +538,20 @@ class ClaimSubmission(BaseModel):
     metadata: Optional[Dict[str, Any]] = Field(default=None, description="Additional metadata")
     user_id: Optional[str] = Field(default=None, description="Submitting user ID")
 
-class ProcessingStatus(BaseModel):
+class ProcessingStatus(msgspec.Struct, kw_only=True):
+    """Status payload for the polled status endpoint, encoded by msgspec without model coercion
+    
+    Agent results and the audit trail are passed through as the JSON already
+    held by the workflow store rather than being decoded and encoded again.
+    """
     claim_id: str
     status: str
     current_agent: Optional[str] = None
     progress_percentage: float
-    estimated_completion: Optional[datetime] = None
-    agent_results: Dict[str, Any] = Field(default_factory=dict)
-    clarification_requests: List[Dict[str, Any]] = Field(default_factory=list)
-    audit_trail: List[Dict[str, Any]] = Field(default_factory=list)
+    estimated_completion: Optional[str] = None
+    agent_results: msgspec.Raw = msgspec.Raw(b"{}")
+    clarification_requests: List[Dict[str, Any]] = msgspec.field(default_factory=list)
+    audit_trail: msgspec.Raw = msgspec.Raw(b"[]")
 
 class ClarificationSubmission(BaseModel):
     request_id: str
@@ -160,8 +577,7 @@ async def submit_claim(claim: ClaimSubmission, background_tasks: BackgroundTasks
             metadata=claim.metadata or {}
         )
         
-        # Initialize workflow tracking
-        app_state.active_workflows[claim_id] = {
+        workflow = {
             "status": "initializing",
             "created_at": datetime.now(timezone.utc),
             "claim_data": claim_data,
@@ -173,8 +589,60 @@ async def submit_claim(claim: ClaimSubmission, background_tasks: BackgroundTasks
             "audit_events": []
         }
         
-        # Start async processing
-        background_tasks.add_task(process_claim_workflow, claim_id, claim_data)
+        # Answer repeat submissions of a recently verified claim from the result cache
+        fingerprint = claim_fingerprint(claim.claim_text)
+        cached_report = await app_state.workflows.get_value(result_cache_key(fingerprint))
+        if cached_report:
+            final_report = {**cached_report, "claim_id": claim_id, "served_from_cache": True}
+            workflow.update(
+                status="completed",
+                progress_percentage=100.0,
+                results={"final_report": final_report},
+                completed_at=datetime.now(timezone.utc)
+            )
+            await app_state.workflows.create(claim_id, workflow)
+            await app_state.workflows.expire(claim_id, COMPLETED_WORKFLOW_TTL_SECONDS)
+            
+            return {
+                "success": True,
+                "claim_id": claim_id,
+                "message": "Claim matches a recently verified claim. Report served from cache.",
+                "cached": True,
+                "final_report": final_report
+            }
+        
+        # Attach to an identical claim that is already being processed instead of crawling again
+        claim_key = inflight_key(fingerprint)
+        inflight_claim_id = await app_state.workflows.set_value_if_absent(
+            claim_key, claim_id, WORKFLOW_TTL_SECONDS
+        )
+        if inflight_claim_id:
+            inflight = await app_state.workflows.get(inflight_claim_id, "status")
+            if inflight and inflight.get("status") not in TERMINAL_STATUSES:
+                return {
+                    "success": True,
+                    "claim_id": inflight_claim_id,
+                    "message": "An identical claim is already being processed. Follow its progress instead.",
+                    "deduplicated": True
+                }
+            # The claim holding the key no longer exists or never released it, so take over
+            await app_state.workflows.set_value(claim_key, claim_id, WORKFLOW_TTL_SECONDS)
+        
+        try:
+            # Initialize workflow tracking
+            await app_state.workflows.create(claim_id, workflow)
+            
+            # Start async processing on the worker fleet, or in-process without a queue
+            if app_state.task_queue:
+                await app_state.task_queue.enqueue_job(
+                    "process_claim_workflow_task", claim_id, orjson.dumps(claim_data).decode()
+                )
+            else:
+                background_tasks.add_task(process_claim_workflow, claim_id, claim_data)
+        except Exception:
+            # Nothing will process this claim, so identical submissions must not wait on it
+            await app_state.workflows.delete_value(claim_key)
+            raise
         
         return {
             "success": True,
@@ -184,166 +652,299 @@ async def submit_claim(claim: ClaimSubmission, background_tasks: BackgroundTasks
         }
         
     except Exception as e:
-        logger.error(f"Error submitting claim: {e}")
+        logger.error("Error submitting claim: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/api/v1/claims/{claim_id}/status", response_model=ProcessingStatus)
-async def get_claim_status(claim_id: str):
+@app.get("/api/v1/claims/{claim_id}/status")
+async def get_claim_status(claim_id: str) -> Response:
     """Get the current status of a claim being processed"""
-    workflow = app_state.active_workflows.get(claim_id)
-    if not workflow:
+    encoded = await app_state.workflows.get_raw(
+        claim_id, "status", "current_agent", "progress_percentage",
+        "estimated_completion", "results", "audit_events", "clarifications"
+    )
+    if not encoded:
         raise HTTPException(status_code=404, detail="Claim not found")
+    workflow = {
+        key: orjson.loads(encoded[key])
+        for key in ("status", "current_agent", "progress_percentage", "estimated_completion")
+        if key in encoded
+    }
     
-    # Get clarification requests
-    clarifications = []
-    if app_state.clarification_manager:
-        pending_clarifications = app_state.clarification_manager.get_pending_requests(claim_id)
-        clarifications = [req.to_dict() for req in pending_clarifications]
+    # Clarification requests live in the workflow entry, wherever the workflow runs
+    clarifications = [
+        request for request in orjson.loads(encoded.get("clarifications", b"[]"))
+        if request.get("status") == ClarificationStatus.PENDING
+    ]
     
-    return ProcessingStatus(
+    status = ProcessingStatus(
         claim_id=claim_id,
         status=workflow["status"],
         current_agent=workflow["current_agent"],
         progress_percentage=workflow["progress_percentage"],
         estimated_completion=workflow.get("estimated_completion"),
-        agent_results=workflow["results"],
+        agent_results=msgspec.Raw(encoded.get("results", b"{}")),
         clarification_requests=clarifications,
-        audit_trail=[event.to_dict() for event in workflow["audit_events"]]
+        audit_trail=msgspec.Raw(encoded.get("audit_events", b"[]"))
     )
+    return Response(content=msgspec.json.encode(status), media_type="application/json")
 
 @app.post("/api/v1/clarifications/{request_id}/respond")
 async def respond_to_clarification(request_id: str, response: ClarificationSubmission):
     """Respond to a human clarification request"""
     try:
-        if not app_state.clarification_manager:
-            raise HTTPException(status_code=503, detail="Clarification system not available")
-        
-        clarification_response = ClarificationResponse(
-            request_id=request_id,
-            response_data=response.response_data,
-            user_id=response.user_id,
-            response_time_seconds=0.0,  # Will be calculated
-            notes=response.notes
-        )
+        # Requests are kept in the shared store, since the workflow may run in another process
+        request = await app_state.workflows.get_value(clarification_request_key(request_id))
+        if request is None:
+            raise HTTPException(status_code=404, detail="Clarification request not found")
         
-        success = await app_state.clarification_manager.submit_response(
-            request_id, clarification_response
+        # Only the first response is accepted, even when several workers race
+        existing = await app_state.workflows.set_value_if_absent(
+            clarification_response_key(request_id),
+            {
+                "response_data": response.response_data,
+                "user_id": response.user_id,
+                "notes": response.notes,
+                "responded_at": datetime.now(timezone.utc)
+            },
+            WORKFLOW_TTL_SECONDS
         )
+        if existing is not None:
+            raise HTTPException(status_code=409, detail="Clarification request already answered")
         
-        if not success:
-            raise HTTPException(status_code=404, detail="Clarification request not found")
+        # Wake the workflow waiting on this request, whichever worker it runs on
+        await app_state.workflows.publish(clarification_channel(request_id), response.response_data)
         
         return {"success": True, "message": "Response submitted successfully"}
         
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"Error responding to clarification: {e}")
+        logger.error("Error responding to clarification: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/api/v1/claims/{claim_id}/audit-trail")
-async def get_audit_trail(claim_id: str):
-    """Get complete audit trail for transparency"""
-    workflow = app_state.active_workflows.get(claim_id)
+async def read_audit_trail(claim_id: str) -> bytes:
+    """Get a claim's audit trail as newline-delimited JSON, or 404 for unknown claims"""
+    workflow = await app_state.workflows.get(claim_id, "status")
     if not workflow:
         raise HTTPException(status_code=404, detail="Claim not found")
     
-    # Get all audit events for this claim
-    claim_events = [event for event in app_state.audit_manager.events 
-                   if event.claim_id == claim_id]
+    # The workflow process copies its events to the shared store as they are logged
+    return await app_state.workflows.get_log(audit_trail_key(claim_id))
+
+@app.get("/api/v1/claims/{claim_id}/audit-trail")
+async def get_audit_trail(claim_id: str) -> Response:
+    """Get complete audit trail for transparency"""
+    trail = await read_audit_trail(claim_id)
     
-    return {
+    # Each line is already a JSON event, so the array is spliced together rather than re-encoded
+    events = trail.rstrip(b"\n").replace(b"\n", b",")
+    body = orjson.dumps({
         "claim_id": claim_id,
-        "total_events": len(claim_events),
-        "audit_trail": [event.to_dict() for event in claim_events],
+        "total_events": trail.count(b"\n"),
+        "audit_trail": orjson.Fragment(b"[" + events + b"]"),
         "plan_run_states": app_state.audit_manager.plan_runs.get(claim_id, [])
-    }
+    }, default=_json_default)
+    return Response(content=body, media_type="application/json")
+
+@app.get("/api/v1/claims/{claim_id}/audit-trail.ndjson")
+async def get_audit_trail_ndjson(claim_id: str) -> Response:
+    """Get the audit trail as newline-delimited JSON, one event per line"""
+    return Response(content=await read_audit_trail(claim_id), media_type="application/x-ndjson")
+
+async def send_json_message(websocket: WebSocket, message: Dict[str, Any]):
+    """Send a JSON text frame encoded with orjson"""
+    await websocket.send_text(orjson.dumps(message, default=_json_default).decode())
+
+# Updates arriving within this window are sent as one WebSocket frame
+WEBSOCKET_BATCH_WINDOW_SECONDS = 0.08
+
+async def next_update_batch(updates: asyncio.Queue,
+                            window_seconds: float = WEBSOCKET_BATCH_WINDOW_SECONDS) -> List[Dict[str, Any]]:
+    """Wait for the next update, then collect any others published within the window"""
+    batch = [await updates.get()]
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + window_seconds
+    
+    while (remaining := deadline - loop.time()) > 0:
+        try:
+            batch.append(await asyncio.wait_for(updates.get(), timeout=remaining))
+        except asyncio.TimeoutError:
+            break
+    
+    return batch
+
+# Workflow statuses after which no further updates are published
+TERMINAL_STATUSES = frozenset({"completed", "error"})
 
 # WebSocket endpoint for real-time updates
 @app.websocket("/api/v1/claims/{claim_id}/ws")
 async def websocket_endpoint(websocket: WebSocket, claim_id: str):
-    """WebSocket connection for real-time claim processing updates"""
+    """WebSocket connection for real-time claim processing updates
+    
+    Client frames are read alongside the update queue so a disconnect is noticed
+    immediately, and the connection is closed once the workflow finishes.
+    """
     await websocket.accept()
     app_state.websocket_connections[claim_id] = websocket
+    receive_task: Optional[asyncio.Task] = None
+    batch_task: Optional[asyncio.Task] = None
     
     try:
-        while True:
-            # Send periodic updates
-            workflow = app_state.active_workflows.get(claim_id)
-            if workflow:
-                update = {
-                    "type": "status_update",
-                    "claim_id": claim_id,
-                    "status": workflow["status"],
-                    "progress": workflow["progress_percentage"],
-                    "current_agent": workflow["current_agent"],
-                    "timestamp": datetime.now(timezone.utc).isoformat()
-                }
-                await websocket.send_json(update)
+        async with app_state.workflows.subscribe(updates_channel(claim_id)) as updates:
+            # Send the current state once, then only push real state transitions
+            snapshot = await build_status_update(claim_id)
+            if snapshot:
+                await send_json_message(websocket, snapshot)
+                if snapshot["status"] in TERMINAL_STATUSES:
+                    await websocket.close()
+                    return
             
-            await asyncio.sleep(2)  # Send updates every 2 seconds
+            receive_task = asyncio.create_task(websocket.receive())
+            batch_task = asyncio.create_task(next_update_batch(updates))
+            while True:
+                done, _ = await asyncio.wait(
+                    (receive_task, batch_task), return_when=asyncio.FIRST_COMPLETED
+                )
+                
+                if receive_task in done:
+                    if receive_task.result()["type"] == "websocket.disconnect":
+                        raise WebSocketDisconnect()
+                    # Clients have nothing to say on this channel, so their frames are ignored
+                    receive_task = asyncio.create_task(websocket.receive())
+                
+                if batch_task in done:
+                    batch = batch_task.result()
+                    if len(batch) == 1:
+                        await send_json_message(websocket, batch[0])
+                    else:
+                        await send_json_message(websocket, {"type": "batch", "events": batch})
+                    if any(update.get("status") in TERMINAL_STATUSES for update in batch):
+                        await websocket.close()
+                        return
+                    batch_task = asyncio.create_task(next_update_batch(updates))
             
     except WebSocketDisconnect:
-        if claim_id in app_state.websocket_connections:
+        logger.info("WebSocket disconnected for claim %s", claim_id)
+    finally:
+        for task in (receive_task, batch_task):
+            if task is not None:
+                task.cancel()
+        if app_state.websocket_connections.get(claim_id) is websocket:
             del app_state.websocket_connections[claim_id]
-        logger.info(f"WebSocket disconnected for claim {claim_id}")
+
+def sse_frame(message: Dict[str, Any]) -> str:
+    """Format a message as a Server-Sent Events data frame"""
+    return f"data: {orjson.dumps(message, default=_json_default).decode()}\n\n"
+
+async def claim_event_source(claim_id: str) -> AsyncIterator[str]:
+    """Yield SSE frames for a claim until its workflow finishes"""
+    async with app_state.workflows.subscribe(updates_channel(claim_id)) as updates:
+        snapshot = await build_status_update(claim_id)
+        if not snapshot:
+            return
+        yield sse_frame(snapshot)
+        if snapshot["status"] in TERMINAL_STATUSES:
+            return
+        
+        while True:
+            update = await updates.get()
+            yield sse_frame(update)
+            if update.get("status") in TERMINAL_STATUSES:
+                return
+
+# Server-Sent Events endpoint for one-way progress streaming
+@app.get("/api/v1/claims/{claim_id}/events")
+async def stream_claim_events(claim_id: str):
+    """Stream claim processing updates as Server-Sent Events"""
+    workflow = await app_state.workflows.get(claim_id, "status")
+    if not workflow:
+        raise HTTPException(status_code=404, detail="Claim not found")
+    
+    return StreamingResponse(
+        claim_event_source(claim_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 # Core workflow processing function
 async def process_claim_workflow(claim_id: str, claim_data: ClaimData):
     """Process a claim through the complete Portia multi-agent workflow"""
-    workflow = app_state.active_workflows[claim_id]
+    fingerprint = claim_fingerprint(claim_data.content)
+    workflow = await app_state.workflows.get(claim_id)
+    if workflow is None:
+        logger.error("No workflow state found for claim %s", claim_id)
+        await app_state.workflows.delete_value(inflight_key(fingerprint))
+        return
+    
+    snapshot = WorkflowSnapshot.from_workflow(workflow)
+    audit_offset = 0
+    
+    async def persist_audit_trail():
+        """Copy audit events logged in this process since the last call to the shared store"""
+        nonlocal audit_offset
+        trail = app_state.audit_manager.get_serialized_audit_trail(claim_id)
+        if len(trail) > audit_offset:
+            await app_state.workflows.append_log(
+                audit_trail_key(claim_id), trail[audit_offset:], WORKFLOW_TTL_SECONDS
+            )
+            audit_offset = len(trail)
+    
+    async def update_workflow(**fields: Any):
+        """Apply field changes locally and persist them to the workflow store
+        
+        Progress fields always land together, so readers never see a status
+        from one step paired with the agent or percentage of another.
+        """
+        nonlocal snapshot
+        progress = {key: fields.pop(key) for key in _SNAPSHOT_FIELDS if key in fields}
+        if progress:
+            snapshot = replace(snapshot, **progress)
+            fields.update(asdict(snapshot))
+        workflow.update(fields)
+        await app_state.workflows.update(claim_id, **fields)
+        await persist_audit_trail()
+    
+    async def announce(message: str):
+        """Broadcast a progress message from the local snapshot, without re-reading the store"""
+        await broadcast_update(claim_id, message, snapshot)
     
     try:
-        logger.info(f"Starting multi-agent workflow for claim {claim_id}")
+        logger.info("Starting multi-agent workflow for claim %s", claim_id)
         
         # Update status
-        workflow["status"] = "processing"
-        workflow["progress_percentage"] = 10.0
-        await broadcast_update(claim_id, "Agent workflow initialized")
+        await update_workflow(status="processing", progress_percentage=10.0)
+        await announce("Agent workflow initialized")
         
         # Step 1: Claim Parser Agent
-        workflow["current_agent"] = "claim_parser"
-        workflow["progress_percentage"] = 20.0
-        await broadcast_update(claim_id, "Parsing claim content...")
+        await update_workflow(current_agent="claim_parser", progress_percentage=20.0)
+        await announce("Parsing claim content...")
         
         if app_state.portia_core:
             parser_agent = ClaimParserAgent(app_state.portia_core, app_state.audit_manager)
             parser_result = await parser_agent.process_claim(claim_data)
             workflow["results"]["parser"] = parser_result.data
             workflow["agents_completed"].append("claim_parser")
+            await update_workflow(results=workflow["results"], agents_completed=workflow["agents_completed"])
         
         # Step 2: Evidence Collector Agent with Web Retrieval
-        workflow["current_agent"] = "evidence_collector"
-        workflow["progress_percentage"] = 40.0
-        await broadcast_update(claim_id, "Collecting evidence from web sources...")
+        await update_workflow(current_agent="evidence_collector", progress_percentage=40.0)
+        await announce("Collecting evidence from web sources...")
         
         if app_state.portia_core and app_state.web_orchestrator:
             collector_agent = EvidenceCollectorAgent(app_state.portia_core, app_state.audit_manager)
             
-            # Create comprehensive crawl job
-            crawl_job = CrawlJob(
-                job_id=f"evidence_{claim_id}",
-                urls=claim_data.source_url and [claim_data.source_url] or [],
-                max_depth=2,
-                max_pages=50,
-                search_terms=claim_data.content.split()[:10],  # First 10 words as search terms
-                strategies=[
-                    SearchStrategy.BROAD_SEARCH,
-                    SearchStrategy.NEWS_FOCUSED,
-                    SearchStrategy.FACT_CHECK_FOCUSED
-                ]
-            )
-            
-            # Execute web retrieval
-            evidence_results = await app_state.web_orchestrator.execute_crawl(crawl_job)
+            # Execute web retrieval, one crawl per search strategy
+            evidence_results = await collect_evidence(claim_id, claim_data)
             
             # Process evidence with agent
             collector_result = await collector_agent.process_claim(claim_data, evidence=evidence_results)
             workflow["results"]["evidence_collector"] = collector_result.data
             workflow["agents_completed"].append("evidence_collector")
+            await update_workflow(results=workflow["results"], agents_completed=workflow["agents_completed"])
         
         # Step 3: Confidence Assessment and Clarification Logic
-        workflow["current_agent"] = "confidence_assessor"
-        workflow["progress_percentage"] = 60.0
-        await broadcast_update(claim_id, "Assessing confidence and checking for conflicts...")
+        await update_workflow(current_agent="confidence_assessor", progress_percentage=60.0)
+        await announce("Assessing confidence and checking for conflicts...")
         
         # Calculate confidence metrics
         confidence = ConfidenceMetrics(
@@ -369,8 +970,8 @@ async def process_claim_workflow(claim_id: str, claim_data: ClaimData):
             should_clarify, priority, reason = decision_result
             
             if should_clarify:
-                workflow["status"] = "awaiting_clarification"
-                await broadcast_update(claim_id, f"Human clarification requested: {reason}")
+                await update_workflow(status="awaiting_clarification")
+                await announce(f"Human clarification requested: {reason}")
                 
                 # Create clarification request
                 clarification_request = ClarificationRequest(
@@ -393,92 +994,216 @@ async def process_claim_workflow(claim_id: str, claim_data: ClaimData):
                     ]
                 )
                 
-                await app_state.clarification_manager.create_request(clarification_request)
-                workflow["clarifications"].append(clarification_request.to_dict())
+                request_entry = clarification_request.to_dict()
+                await app_state.workflows.set_value(
+                    clarification_request_key(clarification_request.request_id),
+                    request_entry,
+                    WORKFLOW_TTL_SECONDS
+                )
+                workflow["clarifications"].append(request_entry)
+                await update_workflow(clarifications=workflow["clarifications"])
                 
                 # Wait for clarification response (with timeout)
-                await wait_for_clarification(claim_id, clarification_request.request_id, timeout_seconds=1800)
+                response_data = await wait_for_clarification(
+                    claim_id, clarification_request.request_id, timeout_seconds=1800
+                )
+                if response_data is None:
+                    request_entry["status"] = ClarificationStatus.EXPIRED
+                else:
+                    request_entry["status"] = ClarificationStatus.COMPLETED
+                    request_entry["response"] = response_data
+                await app_state.workflows.delete_value(
+                    clarification_request_key(clarification_request.request_id)
+                )
+                await update_workflow(clarifications=workflow["clarifications"])
         
         # Step 4: Final Report Generation
-        workflow["current_agent"] = "report_generator"
-        workflow["progress_percentage"] = 80.0
-        await broadcast_update(claim_id, "Generating final report...")
+        await update_workflow(current_agent="report_generator", progress_percentage=80.0)
+        await announce("Generating final report...")
         
-        # Generate comprehensive report
-        final_report = {
-            "claim_id": claim_id,
-            "original_claim": claim_data.content,
-            "reliability_score": confidence.overall_confidence,
-            "confidence_breakdown": confidence.to_dict(),
-            "evidence_summary": workflow["results"].get("evidence_collector", {}),
-            "parsed_claims": workflow["results"].get("parser", {}),
-            "processing_timeline": workflow["audit_events"],
-            "clarifications_used": workflow["clarifications"],
-            "final_verdict": determine_final_verdict(confidence.overall_confidence),
-            "transparency_note": "This report was generated using AI agents with human oversight where needed.",
-            "generated_at": datetime.now(timezone.utc).isoformat()
-        }
+        # Generate comprehensive report, kept as pre-serialized JSON
+        final_report = orjson.Fragment(build_final_report(
+            claim_id, claim_data, confidence, workflow["results"],
+            workflow["audit_events"], workflow["clarifications"]
+        ))
         
         workflow["results"]["final_report"] = final_report
-        workflow["status"] = "completed"
-        workflow["progress_percentage"] = 100.0
-        workflow["completed_at"] = datetime.now(timezone.utc)
+        await update_workflow(
+            results=workflow["results"],
+            status="completed",
+            progress_percentage=100.0,
+            completed_at=datetime.now(timezone.utc)
+        )
+        
+        await announce("Processing completed successfully!")
+        await app_state.workflows.expire(claim_id, COMPLETED_WORKFLOW_TTL_SECONDS)
         
-        await broadcast_update(claim_id, "Processing completed successfully!")
+        # Make the report available to later submissions of the same claim
+        await app_state.workflows.set_value(
+            result_cache_key(fingerprint),
+            final_report,
+            RESULT_CACHE_TTL_SECONDS
+        )
         
-        logger.info(f"Completed processing claim {claim_id}")
+        logger.info("Completed processing claim %s", claim_id)
         
     except Exception as e:
-        logger.error(f"Error processing claim {claim_id}: {e}")
-        workflow["status"] = "error"
-        workflow["error"] = str(e)
-        await broadcast_update(claim_id, f"Processing failed: {str(e)}")
-
-async def broadcast_update(claim_id: str, message: str):
-    """Broadcast update to WebSocket connections"""
-    websocket = app_state.websocket_connections.get(claim_id)
-    if websocket:
-        try:
-            await websocket.send_json({
-                "type": "progress_update",
-                "message": message,
-                "timestamp": datetime.now(timezone.utc).isoformat()
-            })
-        except Exception as e:
-            logger.error(f"Failed to send WebSocket update: {e}")
+        logger.error("Error processing claim %s: %s", claim_id, e)
+        await update_workflow(status="error", error=str(e))
+        await announce(f"Processing failed: {str(e)}")
+    finally:
+        # Later submissions of this claim start fresh or hit the result cache
+        await app_state.workflows.delete_value(inflight_key(fingerprint))
+        await persist_audit_trail()
+
+def build_final_report(claim_id: str, claim_data: ClaimData, confidence: ConfidenceMetrics,
+                       results: Dict[str, Any], audit_events: List[Dict[str, Any]],
+                       clarifications: List[Dict[str, Any]]) -> bytes:
+    """Assemble the final report and serialize it to JSON bytes"""
+    final_report = {
+        "claim_id": claim_id,
+        "original_claim": claim_data.content,
+        "reliability_score": confidence.overall_confidence,
+        "confidence_breakdown": confidence.to_dict(),
+        "evidence_summary": results.get("evidence_collector", {}),
+        "parsed_claims": results.get("parser", {}),
+        "processing_timeline": audit_events,
+        "clarifications_used": clarifications,
+        "final_verdict": determine_final_verdict(confidence.overall_confidence),
+        "transparency_note": "This report was generated using AI agents with human oversight where needed.",
+        "generated_at": datetime.now(timezone.utc).isoformat()
+    }
+    return orjson.dumps(final_report, default=_json_default)
+
+async def collect_evidence(claim_id: str, claim_data: ClaimData) -> List[Any]:
+    """Run the evidence crawls for each search strategy concurrently and merge their results"""
+    # First 10 words as search terms, without tokenizing the rest of a long claim
+    search_terms = [match.group() for match in islice(_WORD_RE.finditer(claim_data.content), 10)]
+    
+    async def crawl(strategy: SearchStrategy) -> List[Any]:
+        crawl_job = CrawlJob(
+            job_id=f"evidence_{claim_id}_{strategy.value}",
+            urls=claim_data.source_url and [claim_data.source_url] or [],
+            max_depth=2,
+            max_pages=50,
+            search_terms=search_terms,
+            strategies=[strategy]
+        )
+        async with app_state.crawl_semaphore:
+            return await app_state.web_orchestrator.execute_crawl(crawl_job)
+    
+    results = await asyncio.gather(*(crawl(s) for s in EVIDENCE_STRATEGIES), return_exceptions=True)
+    
+    evidence = []
+    for strategy, result in zip(EVIDENCE_STRATEGIES, results):
+        if isinstance(result, BaseException):
+            logger.error("Evidence crawl %s failed for claim %s: %s", strategy.value, claim_id, result)
+            continue
+        evidence.extend(result or [])
+    return evidence
+
+async def build_status_update(claim_id: str, message: Optional[str] = None,
+                              snapshot: Optional[WorkflowSnapshot] = None) -> Optional[Dict[str, Any]]:
+    """Build a status update message from a snapshot or the current workflow state"""
+    if snapshot is None:
+        workflow = await app_state.workflows.get(claim_id, *_SNAPSHOT_FIELDS)
+        if not workflow:
+            return None
+        snapshot = WorkflowSnapshot.from_workflow(workflow)
+    
+    update = {
+        "type": "status_update",
+        "claim_id": claim_id,
+        "status": snapshot.status,
+        "progress": snapshot.progress_percentage,
+        "current_agent": snapshot.current_agent,
+        "timestamp": fast_iso_now()
+    }
+    if message is not None:
+        update["type"] = "progress_update"
+        update["message"] = message
+    return update
+
+async def broadcast_update(claim_id: str, message: str, snapshot: Optional[WorkflowSnapshot] = None):
+    """Publish a progress update to subscribed WebSocket connections"""
+    try:
+        update = await build_status_update(claim_id, message, snapshot)
+        if update:
+            await app_state.workflows.publish(updates_channel(claim_id), update)
+    except Exception as e:
+        logger.error("Failed to publish WebSocket update: %s", e)
 
 async def wait_for_clarification(claim_id: str, request_id: str, timeout_seconds: int = 1800):
-    """Wait for clarification response with timeout"""
-    start_time = datetime.now(timezone.utc)
-    while (datetime.now(timezone.utc) - start_time).total_seconds() < timeout_seconds:
-        if app_state.clarification_manager:
-            request = app_state.clarification_manager.get_request(request_id)
-            if request and request.status == ClarificationStatus.COMPLETED:
-                logger.info(f"Clarification received for claim {claim_id}")
-                return request.response
-        await asyncio.sleep(5)  # Check every 5 seconds
+    """Wait for clarification response with timeout, resuming as soon as it is submitted"""
+    async with app_state.workflows.subscribe(clarification_channel(request_id)) as responses:
+        # The response may have been submitted before the subscription was in place
+        submitted = await app_state.workflows.get_value(clarification_response_key(request_id))
+        if submitted is not None:
+            logger.info("Clarification received for claim %s", claim_id)
+            return submitted["response_data"]
+        
+        try:
+            response = await asyncio.wait_for(responses.get(), timeout=timeout_seconds)
+        except asyncio.TimeoutError:
+            logger.warning("Clarification timeout for claim %s", claim_id)
+            return None
     
-    logger.warning(f"Clarification timeout for claim {claim_id}")
-    return None
+    logger.info("Clarification received for claim %s", claim_id)
+    return response
+
+# Task queue worker - run with ``arq main.WorkerSettings``
+async def process_claim_workflow_task(ctx: Dict[str, Any], claim_id: str, claim_data_json: str):
+    """ARQ task running a claim workflow in a dedicated worker process"""
+    data = orjson.loads(claim_data_json)
+    if data.get("timestamp"):
+        data["timestamp"] = datetime.fromisoformat(data["timestamp"])
+    await process_claim_workflow(claim_id, ClaimData(**data))
+
+async def worker_startup(ctx: Dict[str, Any]):
+    """Initialize Portia components for an ARQ worker process"""
+    await app_state.initialize()
+
+async def worker_shutdown(ctx: Dict[str, Any]):
+    """Release Portia components for an ARQ worker process"""
+    await app_state.shutdown()
+
+class WorkerSettings:
+    """ARQ worker configuration for claim processing"""
+    functions = [process_claim_workflow_task]
+    on_startup = worker_startup
+    on_shutdown = worker_shutdown
+    redis_settings = RedisSettings.from_dsn(os.getenv("REDIS_URL", "redis://localhost:6379/0"))
+    # Workflows may wait up to 30 minutes for a human clarification
+    job_timeout = 3600
+
+# Verdict bands: a score at or above each threshold moves up to the next verdict
+_VERDICT_THRESHOLDS = (0.2, 0.4, 0.6, 0.8)
+_VERDICTS = ("Highly Unreliable", "Likely Unreliable", "Uncertain", "Likely Reliable", "Highly Reliable")
 
 def determine_final_verdict(reliability_score: float) -> str:
     """Determine final verdict based on reliability score"""
-    if reliability_score >= 0.8:
-        return "Highly Reliable"
-    elif reliability_score >= 0.6:
-        return "Likely Reliable"
-    elif reliability_score >= 0.4:
-        return "Uncertain"
-    elif reliability_score >= 0.2:
-        return "Likely Unreliable"
-    else:
-        return "Highly Unreliable"
+    return _VERDICTS[bisect.bisect_right(_VERDICT_THRESHOLDS, reliability_score)]
 
 if __name__ == "__main__":
+    # Auto-reload is for local development and cannot be combined with multiple workers
+    reload = os.getenv("AI_DETECTIVE_API_RELOAD", "false").lower() == "true"
+    # Workers only share state through Redis, so without it the API runs as a single process
+    redis_configured = bool(os.getenv("REDIS_URL"))
+    default_workers = max(2, os.cpu_count() or 1) if redis_configured else 1
+    workers = int(os.getenv("AI_DETECTIVE_API_WORKERS", str(default_workers)))
+    if workers > 1 and not redis_configured:
+        logger.warning("%d API workers without REDIS_URL - each worker sees only its own claims", workers)
+    
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
-        port=8000,
-        reload=True,
+        port=int(os.getenv("AI_DETECTIVE_API_PORT", "8000")),
+        reload=reload,
+        workers=1 if reload else workers,
+        loop="uvloop",
+        http="httptools",
+        limit_concurrency=1000,
+        timeout_keep_alive=30,
+        ws_per_message_deflate=True,
         log_level="info"
     )
@@ -8,103 +8,185 @@ This example shows:
 2. Automatic conflict detection and clarification triggering
 3. Processing human responses to clarification requests
 4. Monitoring and audit trail functionality
+
+Set AI_DETECTIVE_DEMO_HUMAN_LATENCY to a number of seconds to make the simulated
+human reviewer pause before answering; it defaults to 0 so automated runs are not
+slowed down.
 """
 
 import asyncio
-import json
+import functools
 import logging
-import uuid
-from datetime import datetime, timezone
+import os
+import secrets
+import sys
+import time
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Final, Mapping
 
-# Import core components
-from portia_core import (
-    create_detective_core, ClaimData, DetectiveAgentType, AgentResult
-)
-from clarification_system import (
-    create_clarification_system, ClarificationPriority, ClarificationStatus,
-    ConflictType, EvidenceConflict, ConfidenceMetrics
-)
+# Core components are imported where they are used, so importing this module
+# does not pay for SDK and clarification system setup until a demo runs
+if TYPE_CHECKING:
+    from portia_core import AgentResult
+    from clarification_system import ClarificationRequest, HumanInTheLoopClarificationSystem
 
-# Configure logging for the example
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
+# Status output goes through this logger; it is only switched to INFO when run as a script
+logger = logging.getLogger("clarification_demo")
+
+# Seconds the simulated human reviewer takes to answer
+HUMAN_LATENCY = float(os.getenv("AI_DETECTIVE_DEMO_HUMAN_LATENCY", "0"))
 
 
 async def clarification_callback(request):
     """Example callback function that would integrate with UI/notification system"""
-    print(f"\n🔔 CLARIFICATION REQUESTED")
-    print(f"   Request ID: {request.request_id}")
-    print(f"   Title: {request.title}")
-    print(f"   Type: {request.clarification_type.value}")
-    print(f"   Priority: {request.priority.value}")
-    print(f"   Description: {request.description}")
+    logger.info("\n🔔 CLARIFICATION REQUESTED")
+    logger.info("   Request ID: %s", request.request_id)
+    logger.info("   Title: %s", request.title)
+    logger.info("   Type: %s", request.clarification_type.value)
+    logger.info("   Priority: %s", request.priority.value)
+    logger.info("   Description: %s", request.description)
     
     if request.options:
-        print(f"   Options available: {len(request.options)}")
+        logger.info("   Options available: %s", len(request.options))
         for i, option in enumerate(request.options):
-            print(f"     {i+1}. {option.get('label', 'Option')} - {option.get('description', '')}")
+            logger.info("     %s. %s - %s", i + 1, option.get('label', 'Option'), option.get('description', ''))
     
-    print(f"   Timeout: {request.timeout_seconds}s")
-    print("   🔗 This would trigger UI notification/email to human reviewer")
+    logger.info("   Timeout: %ss", request.timeout_seconds)
+    logger.info("   🔗 This would trigger UI notification/email to human reviewer")
 
 
-def create_mock_evidence_with_conflicts():
-    """Create mock evidence data with intentional conflicts for demonstration"""
-    return [
-        {
-            "source": "Medical Authority Website",
-            "source_url": "https://medical-authority.example.com",
-            "verdict": "false",
-            "confidence": 0.95,
-            "credibility_score": 0.9,
-            "facts": {
-                "microchip_size": None,  # No microchips found
-                "vaccine_ingredients": ["mRNA", "lipids", "salts"]
+@functools.lru_cache(maxsize=1)
+def _core():
+    """Detective core shared by both demos"""
+    from portia_core import create_detective_core
+    return create_detective_core()
+
+
+@functools.lru_cache(maxsize=1)
+def _clarification():
+    """Clarification system shared by both demos, built once with the demo callback"""
+    from clarification_system import create_clarification_system
+    clarification = create_clarification_system(_core(), {
+        "decision_engine": {
+            "confidence_thresholds": {
+                "low": 0.5,
+                "medium": 0.7,
+                "high": 0.85
             },
-            "verified": True
+            "conflict_severity_threshold": 0.6
+        }
+    })
+    clarification.register_clarification_callback(clarification_callback)
+    return clarification
+
+
+class _OutputBuffer:
+    """Collects a section's status lines and logs them as a single message"""
+    
+    def __init__(self):
+        self.lines = []
+        
+    def line(self, msg, *args):
+        self.lines.append((msg, args))
+        
+    def flush(self):
+        # Lines are only formatted when the demo logger would emit them
+        if self.lines and logger.isEnabledFor(logging.INFO):
+            logger.info("\n".join(msg % args if args else msg for msg, args in self.lines))
+        self.lines.clear()
+
+
+# Mock evidence is built once at import and shared read-only by every run
+_EVIDENCE_WITH_CONFLICTS: Final = (
+    {
+        "source": "Medical Authority Website",
+        "source_url": "https://medical-authority.example.com",
+        "verdict": "false",
+        "confidence": 0.95,
+        "credibility_score": 0.9,
+        "facts": {
+            "microchip_size": None,  # No microchips found
+            "vaccine_ingredients": ["mRNA", "lipids", "salts"]
         },
-        {
-            "source": "Conspiracy Blog", 
-            "source_url": "https://conspiracy-blog.example.com",
-            "verdict": "true",
-            "confidence": 0.8,
-            "credibility_score": 0.2,
-            "facts": {
-                "microchip_size": "5nm",  # Claims microchips present
-                "vaccine_ingredients": ["mRNA", "microchips", "tracking_devices"]
-            },
-            "verified": False
+        "verified": True
+    },
+    {
+        "source": "Conspiracy Blog", 
+        "source_url": "https://conspiracy-blog.example.com",
+        "verdict": "true",
+        "confidence": 0.8,
+        "credibility_score": 0.2,
+        "facts": {
+            "microchip_size": "5nm",  # Claims microchips present
+            "vaccine_ingredients": ["mRNA", "microchips", "tracking_devices"]
         },
-        {
-            "source": "Independent Fact Checker",
-            "source_url": "https://factcheck.example.com", 
-            "verdict": "false",
-            "confidence": 0.85,
-            "credibility_score": 0.85,
-            "facts": {
-                "microchip_size": None,
-                "vaccine_ingredients": ["mRNA", "lipids", "salts", "preservatives"]
-            },
-            "verified": True
+        "verified": False
+    },
+    {
+        "source": "Independent Fact Checker",
+        "source_url": "https://factcheck.example.com", 
+        "verdict": "false",
+        "confidence": 0.85,
+        "credibility_score": 0.85,
+        "facts": {
+            "microchip_size": None,
+            "vaccine_ingredients": ["mRNA", "lipids", "salts", "preservatives"]
         },
-        {
-            "source": "Social Media Post",
-            "source_url": "https://socialmedia.example.com/post123",
-            "verdict": "disputed",
-            "confidence": 0.3,
-            "credibility_score": 0.1,
-            "facts": {
-                "microchip_size": "unknown",
-                "vaccine_ingredients": ["unknown substances"]
-            },
-            "verified": False
-        }
-    ]
+        "verified": True
+    },
+    {
+        "source": "Social Media Post",
+        "source_url": "https://socialmedia.example.com/post123",
+        "verdict": "disputed",
+        "confidence": 0.3,
+        "credibility_score": 0.1,
+        "facts": {
+            "microchip_size": "unknown",
+            "vaccine_ingredients": ["unknown substances"]
+        },
+        "verified": False
+    }
+)
+
+
+# Evidence with multiple conflict types for the advanced detection demo
+_COMPLEX_EVIDENCE: Final = (
+    {
+        "source": "Source A",
+        "verdict": "true",
+        "confidence": 0.9,
+        "credibility_score": 0.8,
+        "facts": {"death_toll": 1000, "date": "2024-01-15"},
+        "timeline": {"event_start": "2024-01-15", "event_end": "2024-01-16"}
+    },
+    {
+        "source": "Source B", 
+        "verdict": "false",
+        "confidence": 0.85,
+        "credibility_score": 0.7,
+        "facts": {"death_toll": 1500, "date": "2024-01-15"},  # Conflicting number
+        "timeline": {"event_start": "2024-01-14", "event_end": "2024-01-17"}  # Conflicting timeline
+    },
+    {
+        "source": "Source A",  # Same source, different credibility assessment
+        "verdict": "true", 
+        "confidence": 0.9,
+        "credibility_score": 0.3,  # Conflicting credibility score for same source
+        "facts": {"death_toll": 950, "date": "2024-01-15"},
+    }
+)
 
 
-def create_mock_agent_results():
-    """Create mock agent results with varying confidence levels"""
-    return {
+def create_mock_evidence_with_conflicts():
+    """Return mock evidence data with intentional conflicts for demonstration"""
+    return _EVIDENCE_WITH_CONFLICTS
+
+
+@functools.lru_cache(maxsize=1)
+def create_mock_agent_results() -> Mapping[str, "AgentResult"]:
+    """Return mock agent results with varying confidence levels, built once on first use"""
+    from portia_core import AgentResult, DetectiveAgentType
+    return MappingProxyType({
         "claim_parser": AgentResult(
             agent_type=DetectiveAgentType.CLAIM_PARSER,
             success=True,
@@ -139,23 +221,48 @@ def create_mock_agent_results():
             },
             confidence=0.3  # Very low confidence, recommending human review
         )
-    }
+    })
 
 
-async def simulate_human_response(clarification, request):
+@functools.lru_cache(maxsize=1)
+def _complex_agent_results() -> Mapping[str, "AgentResult"]:
+    """Agent results with a conflicting verdict for the advanced detection demo"""
+    from portia_core import AgentResult, DetectiveAgentType
+    return MappingProxyType({
+        "agent1": AgentResult(agent_type=DetectiveAgentType.CLAIM_PARSER, success=True, data={"verdict": "true"}, confidence=0.8),
+        "agent2": AgentResult(agent_type=DetectiveAgentType.EVIDENCE_COLLECTOR, success=True, data={"verdict": "false"}, confidence=0.7)  # Conflicting verdict
+    })
+
+
+def _report_fused_verdicts(out, evidence_list):
+    """Add the confidence- and credibility-weighted verdict split to the output"""
+    from clarification_system import fuse_verdicts
+    fused = fuse_verdicts(evidence_list)
+    out.line("   ⚖️  Weighted verdicts: true %.2f, false %.2f, disputed %.2f",
+             fused['true'], fused['false'], fused['disputed'])
+
+
+async def _await_with_timeout(awaitable, timeout_seconds):
+    """Await with a deadline"""
+    async with asyncio.timeout(timeout_seconds):
+        return await awaitable
+
+
+async def simulate_human_response(clarification: "HumanInTheLoopClarificationSystem",
+                                  request: "ClarificationRequest",
+                                  latency: float = HUMAN_LATENCY):
     """Simulate a human responding to a clarification request"""
-    print(f"\n🤖 SIMULATING HUMAN RESPONSE for {request.request_id}")
+    from clarification_system import ClarificationStatus
+    
+    logger.info("\n🤖 SIMULATING HUMAN RESPONSE for %s", request.request_id)
     
     # Simulate human taking time to review
-    await asyncio.sleep(2)
+    if latency:
+        await asyncio.sleep(latency)
     
     if request.clarification_type.value == "multiple_choice" and request.options:
         # Human chooses the most credible source
-        medical_authority_option = None
-        for option in request.options:
-            if "Medical Authority" in option.get("label", ""):
-                medical_authority_option = option
-                break
+        medical_authority_option = request.options_by_source.get("Medical Authority Website")
         
         if medical_authority_option:
             response_data = {
@@ -177,192 +284,217 @@ async def simulate_human_response(clarification, request):
             "notes": "Evidence strongly supports rejecting the claim despite conflicts"
         }
     
-    # Process the response
-    response = await clarification.process_clarification_response(
-        request.request_id,
-        response_data,
-        "human_reviewer_demo"
-    )
+    # Process the response, giving up once the request's own timeout has passed
+    try:
+        response = await _await_with_timeout(
+            clarification.process_clarification_response(
+                request.request_id,
+                response_data,
+                "human_reviewer_demo"
+            ),
+            request.timeout_seconds
+        )
+    except asyncio.TimeoutError:
+        clarification.state_tracker.update_request_status(request.request_id, ClarificationStatus.EXPIRED)
+        logger.info("   ⌛ Response timed out after %ss", request.timeout_seconds)
+        return None
     
-    print(f"   ✅ Response processed in {response.response_time_seconds:.2f} seconds")
-    print(f"   💭 Human notes: {response.notes}")
+    logger.info("   ✅ Response processed in %.2f seconds", response.response_time_seconds)
+    logger.info("   💭 Human notes: %s", response.notes)
     return response
 
 
-async def demonstrate_clarification_system():
+async def demonstrate_clarification_system(core=None, clarification=None):
     """Main demonstration of the clarification system"""
-    print("🚀 AI Detective - Human-in-the-Loop Clarification System Demo")
-    print("=" * 65)
+    from portia_core import ClaimData
+    from clarification_system import agent_confidence_consensus
+    
+    out = _OutputBuffer()
+    out.line("🚀 AI Detective - Human-in-the-Loop Clarification System Demo")
+    out.line("=" * 65)
     
     # Initialize core system
-    print("\n1️⃣  Initializing AI Detective Core...")
-    core = create_detective_core()
+    out.line("\n1️⃣  Initializing AI Detective Core...")
+    core = core or _core()
     
     # Initialize clarification system
-    print("2️⃣  Initializing Clarification System...")
-    clarification = create_clarification_system(core, {
-        "decision_engine": {
-            "confidence_thresholds": {
-                "low": 0.5,
-                "medium": 0.7,
-                "high": 0.85
-            },
-            "conflict_severity_threshold": 0.6
-        }
-    })
-    
-    # Register our callback
-    clarification.register_clarification_callback(clarification_callback)
+    out.line("2️⃣  Initializing Clarification System...")
+    clarification = clarification or _clarification()
     
     # Create example claim with controversy
-    print("\n3️⃣  Creating Example Claim...")
-    claim = ClaimData(
-        claim_id=str(uuid.uuid4()),
+    out.line("\n3️⃣  Creating Example Claim...")
+    claim = ClaimData.from_ns(
+        time.time_ns(),
+        claim_id=secrets.token_hex(16),
         content="COVID-19 vaccines contain microchips for tracking people",
         source_url="https://example.com/controversial-claim",
-        submitter_id="user_12345",
-        timestamp=datetime.now(timezone.utc)
+        submitter_id="user_12345"
     )
-    print(f"   📝 Claim: {claim.content}")
+    out.line("   📝 Claim: %s", claim.content)
+    out.flush()
     
     # Create mock evidence and agent results with conflicts
-    print("\n4️⃣  Gathering Evidence & Agent Results...")
+    out.line("\n4️⃣  Gathering Evidence & Agent Results...")
     evidence_list = create_mock_evidence_with_conflicts()
     agent_results = create_mock_agent_results()
     
-    print(f"   📊 Evidence sources: {len(evidence_list)}")
-    print(f"   🤖 Agents executed: {len(agent_results)}")
+    out.line("   📊 Evidence sources: %s", len(evidence_list))
+    out.line("   🤖 Agents executed: %s", len(agent_results))
+    _report_fused_verdicts(out, evidence_list)
+    out.flush()
     
     # Calculate confidence metrics
-    print("\n5️⃣  Calculating Confidence Metrics...")
-    confidence = clarification.calculate_confidence_metrics(evidence_list, agent_results)
+    out.line("\n5️⃣  Calculating Confidence Metrics...")
+    consensus, agreement = agent_confidence_consensus(agent_results)
+    confidence = clarification.calculate_confidence_metrics(
+        evidence_list, agent_results, agent_consensus=consensus
+    )
     
-    print(f"   📈 Overall Confidence: {confidence.overall_confidence:.2f}")
-    print(f"   🔍 Source Reliability: {confidence.source_reliability:.2f}")
-    print(f"   ✅ Fact Verification: {confidence.fact_verification:.2f}")
-    print(f"   ⏰ Temporal Consistency: {confidence.temporal_consistency:.2f}")
-    print(f"   🔗 Cross-Reference Score: {confidence.cross_reference_score:.2f}")
-    print(f"   🛠️  Methodology Score: {confidence.methodology_score:.2f}")
+    out.line(
+        "   📈 Overall Confidence: %.2f\n"
+        "   🔍 Source Reliability: %.2f\n"
+        "   ✅ Fact Verification: %.2f\n"
+        "   ⏰ Temporal Consistency: %.2f\n"
+        "   🔗 Cross-Reference Score: %.2f\n"
+        "   🛠️  Methodology Score: %.2f\n"
+        "   🤝 Agent Consensus: %.2f (agreement %.2f)",
+        confidence.overall_confidence,
+        confidence.source_reliability,
+        confidence.fact_verification,
+        confidence.temporal_consistency,
+        confidence.cross_reference_score,
+        confidence.methodology_score,
+        consensus,
+        agreement,
+    )
+    out.flush()
     
     # Evaluate and potentially request clarification
-    print("\n6️⃣  Evaluating Need for Human Clarification...")
+    out.line("\n6️⃣  Evaluating Need for Human Clarification...")
+    out.flush()
     request = await clarification.evaluate_and_request_clarification(
         claim, agent_results, evidence_list, confidence
     )
     
     if request:
-        print(f"   🎯 Clarification System Decision: HUMAN REVIEW REQUIRED")
-        print(f"   🏷️  Type: {request.clarification_type.value}")
-        print(f"   ⚡ Priority: {request.priority.value}")
+        out.line("   🎯 Clarification System Decision: HUMAN REVIEW REQUIRED")
+        out.line("   🏷️  Type: %s", request.clarification_type.value)
+        out.line("   ⚡ Priority: %s", request.priority.value)
         
         # Simulate human response
-        print("\n7️⃣  Processing Human Response...")
+        out.line("\n7️⃣  Processing Human Response...")
+        out.flush()
         await simulate_human_response(clarification, request)
         
         # Show final status
         final_request = clarification.state_tracker.get_request_status(request.request_id)
-        print(f"   📊 Final Status: {final_request.status.value}")
+        out.line("   📊 Final Status: %s", final_request.status.value)
         
     else:
-        print(f"   ✅ System Decision: NO CLARIFICATION NEEDED")
+        out.line("   ✅ System Decision: NO CLARIFICATION NEEDED")
+    out.flush()
     
     # Display monitoring information
-    print("\n8️⃣  System Monitoring & Analytics...")
+    out.line("\n8️⃣  System Monitoring & Analytics...")
     pending = clarification.get_pending_clarifications()
     claim_clarifications = clarification.get_claim_clarifications(claim.claim_id)
     
-    print(f"   📋 Pending clarifications: {len(pending)}")
-    print(f"   📑 Clarifications for this claim: {len(claim_clarifications)}")
+    out.line("   📋 Pending clarifications: %s", len(pending))
+    out.line("   📑 Clarifications for this claim: %s", len(claim_clarifications))
     
     # Export audit data
     audit_data = clarification.state_tracker.export_clarification_audit(claim.claim_id)
-    print(f"   📚 Audit events: {audit_data['request_count']} requests, {len(audit_data['responses'])} responses")
+    out.line("   📚 Audit events: %s requests, %s responses", audit_data['request_count'], len(audit_data['responses']))
+    out.flush()
     
     # Show system health
-    print("\n9️⃣  System Health Check...")
+    out.line("\n9️⃣  System Health Check...")
+    out.flush()
+    # Audit events are written in batches; include any still queued in the count
+    await clarification.state_tracker.flush_audit_events()
     health = await core.health_check()
-    print(f"   💚 System Status: {'Healthy' if health['configuration_valid'] else 'Issues Detected'}")
-    print(f"   🔌 Portia SDK: {'Available' if health['portia_sdk_available'] else 'Unavailable'}")
-    print(f"   📊 Total Audit Events: {health['total_audit_events']}")
+    out.line("   💚 System Status: %s", 'Healthy' if health['configuration_valid'] else 'Issues Detected')
+    out.line("   🔌 Portia SDK: %s", 'Available' if health['portia_sdk_available'] else 'Unavailable')
+    out.line("   📊 Total Audit Events: %s", health['total_audit_events'])
     
-    print("\n" + "=" * 65)
-    print("🎉 Demo completed successfully!")
-    print("💡 In production, clarification callbacks would integrate with:")
-    print("   • Web dashboard for human reviewers")
-    print("   • Email/Slack notifications")  
-    print("   • Queue management systems")
-    print("   • Analytics and reporting dashboards")
+    out.line("\n" + "=" * 65)
+    out.line("🎉 Demo completed successfully!")
+    out.line("💡 In production, clarification callbacks would integrate with:")
+    out.line("   • Web dashboard for human reviewers")
+    out.line("   • Email/Slack notifications")  
+    out.line("   • Queue management systems")
+    out.line("   • Analytics and reporting dashboards")
+    out.flush()
 
 
-async def run_advanced_conflict_detection_demo():
+async def run_advanced_conflict_detection_demo(clarification=None):
     """Demonstrate advanced conflict detection capabilities"""
-    print("\n\n🔬 ADVANCED CONFLICT DETECTION DEMO")
-    print("=" * 50)
-    
-    # Initialize systems
-    core = create_detective_core()
-    clarification = create_clarification_system(core)
-    
-    # Create evidence with multiple conflict types
-    complex_evidence = [
-        {
-            "source": "Source A",
-            "verdict": "true",
-            "confidence": 0.9,
-            "credibility_score": 0.8,
-            "facts": {"death_toll": 1000, "date": "2024-01-15"},
-            "timeline": {"event_start": "2024-01-15", "event_end": "2024-01-16"}
-        },
-        {
-            "source": "Source B", 
-            "verdict": "false",
-            "confidence": 0.85,
-            "credibility_score": 0.7,
-            "facts": {"death_toll": 1500, "date": "2024-01-15"},  # Conflicting number
-            "timeline": {"event_start": "2024-01-14", "event_end": "2024-01-17"}  # Conflicting timeline
-        },
-        {
-            "source": "Source A",  # Same source, different credibility assessment
-            "verdict": "true", 
-            "confidence": 0.9,
-            "credibility_score": 0.3,  # Conflicting credibility score for same source
-            "facts": {"death_toll": 950, "date": "2024-01-15"},
-        }
-    ]
+    from clarification_system import agent_confidence_consensus
     
-    agent_results = {
-        "agent1": AgentResult(DetectiveAgentType.CLAIM_PARSER, True, {"verdict": "true"}, confidence=0.8),
-        "agent2": AgentResult(DetectiveAgentType.EVIDENCE_COLLECTOR, True, {"verdict": "false"}, confidence=0.7)  # Conflicting verdict
-    }
+    out = _OutputBuffer()
+    out.line("\n\n🔬 ADVANCED CONFLICT DETECTION DEMO")
+    out.line("=" * 50)
+    
+    # Reuse the shared systems; conflict detection is stateless
+    clarification = clarification or _clarification()
     
-    # Detect conflicts
-    conflicts = clarification.conflict_detector.detect_conflicts(complex_evidence, agent_results)
+    # Evidence and agent results with multiple conflict types
+    complex_evidence = _COMPLEX_EVIDENCE
+    agent_results = _complex_agent_results()
     
-    print(f"🔍 Detected {len(conflicts)} conflicts:")
+    _report_fused_verdicts(out, complex_evidence)
+    consensus, agreement = agent_confidence_consensus(agent_results)
+    out.line("   🤝 Agent Consensus: %.2f (agreement %.2f)", consensus, agreement)
+    
+    # Detect conflicts, grouping the evidence once up front; the detector memoizes repeats
+    detector = clarification.conflict_detector
+    conflicts = detector.detect_conflicts(
+        complex_evidence, agent_results,
+        prebuilt_indices=detector.build_indices(complex_evidence)
+    )
+    
+    out.line("🔍 Detected %s conflicts:", len(conflicts))
     for i, conflict in enumerate(conflicts):
-        print(f"   {i+1}. {conflict.conflict_type.value}")
-        print(f"      Severity: {conflict.severity:.2f}")
-        print(f"      Description: {conflict.conflict_description}")
-        print(f"      Sources involved: {len(conflict.conflicting_sources)}")
+        out.line("   %s. %s", i + 1, conflict.conflict_type.value)
+        out.line("      Severity: %.2f", conflict.severity)
+        out.line("      Description: %s", conflict.conflict_description)
+        out.line("      Sources involved: %s", len(conflict.conflicting_sources))
     
-    print("\n✨ This demonstrates the system's ability to automatically detect:")
-    print("   • Contradictory source verdicts")
-    print("   • Numerical fact discrepancies") 
-    print("   • Credibility assessment conflicts")
-    print("   • Timeline inconsistencies")
-    print("   • Methodology conflicts between agents")
+    out.line("\n✨ This demonstrates the system's ability to automatically detect:")
+    out.line("   • Contradictory source verdicts")
+    out.line("   • Numerical fact discrepancies") 
+    out.line("   • Credibility assessment conflicts")
+    out.line("   • Timeline inconsistencies")
+    out.line("   • Methodology conflicts between agents")
+    out.flush()
+
+
+async def _main():
+    """Run both demos on one event loop so their waits overlap"""
+    # Output only interleaves at await points, so each printed section stays intact
+    core = _core()
+    clarification = _clarification()
+    try:
+        await asyncio.gather(
+            demonstrate_clarification_system(core, clarification),
+            run_advanced_conflict_detection_demo(clarification)
+        )
+    finally:
+        await clarification.aclose()
 
 
 if __name__ == "__main__":
     """Run the clarification system demonstration"""
-    print("Starting Human-in-the-Loop Clarification System Demo...\n")
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    
+    logger.info("Starting Human-in-the-Loop Clarification System Demo...\n")
     
     try:
-        # Run main demo
-        asyncio.run(demonstrate_clarification_system())
-        
-        # Run advanced conflict detection demo
-        asyncio.run(run_advanced_conflict_detection_demo())
+        asyncio.run(_main())
         
     except KeyboardInterrupt:
         print("\n\n⏹️  Demo interrupted by user")
@@ -21,14 +21,23 @@ Integration:
 """
 
 import asyncio
+import hashlib
+import heapq
+import inspect
 import logging
-import json
 import uuid
+import threading
+import time
 from datetime import datetime, timezone
-from typing import Dict, Any, List, Optional, Union, Callable, Tuple
-from dataclasses import dataclass, asdict
-from enum import Enum
+from typing import Dict, Any, List, Optional, Union, Callable, Tuple, AsyncIterator
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from enum import StrEnum
+from types import MappingProxyType
 import statistics
+import orjson
+from cachetools import TTLCache
+from collections import Counter, defaultdict
 from abc import ABC, abstractmethod
 
 # Import from portia_core foundation
@@ -50,12 +59,115 @@ except ImportError as e:
     class BaseModel:
         pass
 
+# Optional vectorized and JIT-compiled evidence scoring
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = NUMPY_AVAILABLE
+except ImportError:
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """Run the decorated function as plain Python when Numba is absent"""
+        return lambda func: func
+
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
 
-class ClarificationType(Enum):
+@njit(cache=True, fastmath=True)
+def _mean_and_stdev(values):
+    """Return the mean and sample standard deviation of two or more values"""
+    n = len(values)
+    total = 0.0
+    for i in range(n):
+        total += values[i]
+    mean = total / n
+    squares = 0.0
+    for i in range(n):
+        diff = values[i] - mean
+        squares += diff * diff
+    return mean, (squares / (n - 1)) ** 0.5
+
+
+def _fact_spread(values: List[float]) -> Tuple[float, float]:
+    """Mean and sample standard deviation of two or more numerical fact values"""
+    if NUMPY_AVAILABLE:
+        arr = np.fromiter(values, dtype=np.float64, count=len(values))
+        if NUMBA_AVAILABLE:
+            return _mean_and_stdev(arr)
+        return float(arr.mean()), float(arr.std(ddof=1))
+    return _mean_and_stdev(values)
+
+
+if NUMBA_AVAILABLE:
+    # Compile on import so the first detection does not pay for it
+    _mean_and_stdev(np.zeros(2, dtype=np.float64))
+
+
+def agent_confidence_consensus(agent_results: Dict[str, AgentResult]) -> Tuple[float, float]:
+    """
+    Return the median agent confidence and the agents' agreement
+    
+    Agreement is 1 minus the spread between the most and least confident agent.
+    With no reported confidences both default to 0.5 and 1.0.
+    """
+    confidences = [r.confidence for r in agent_results.values() if r.confidence is not None]
+    if not confidences:
+        return 0.5, 1.0
+    if NUMPY_AVAILABLE:
+        confs = np.fromiter(confidences, dtype=np.float64, count=len(confidences))
+        return float(np.median(confs)), 1.0 - float(np.ptp(confs))
+    return statistics.median(confidences), 1.0 - (max(confidences) - min(confidences))
+
+
+# Verdict classes fused by fuse_verdicts: supported, refuted, disputed
+FUSED_VERDICTS = ("true", "false", "disputed")
+
+
+def fuse_verdicts(evidence_list: List[Dict[str, Any]], alpha: float = 0.5) -> Dict[str, float]:
+    """
+    Fuse source verdicts into weighted proportions per verdict class
+    
+    Each source weighs alpha * confidence + (1 - alpha) * credibility_score;
+    proportions are taken over the total weight of all sources.
+    """
+    if not evidence_list:
+        return dict.fromkeys(FUSED_VERDICTS, 0.0)
+        
+    if NUMPY_AVAILABLE:
+        count = len(evidence_list)
+        verdicts = np.array([str(e.get("verdict", "unknown")).lower() for e in evidence_list])
+        weights = (
+            alpha * np.fromiter((e.get("confidence", 0.0) for e in evidence_list), dtype=np.float64, count=count)
+            + (1 - alpha) * np.fromiter((e.get("credibility_score", 0.0) for e in evidence_list),
+                                        dtype=np.float64, count=count)
+        )
+        total = weights.sum()
+        if total <= 0:
+            return dict.fromkeys(FUSED_VERDICTS, 0.0)
+        return {verdict: float(weights[verdicts == verdict].sum() / total) for verdict in FUSED_VERDICTS}
+        
+    totals = dict.fromkeys(FUSED_VERDICTS, 0.0)
+    total = 0.0
+    for e in evidence_list:
+        weight = alpha * e.get("confidence", 0.0) + (1 - alpha) * e.get("credibility_score", 0.0)
+        total += weight
+        verdict = str(e.get("verdict", "unknown")).lower()
+        if verdict in totals:
+            totals[verdict] += weight
+    if total <= 0:
+        return dict.fromkeys(FUSED_VERDICTS, 0.0)
+    return {verdict: weight / total for verdict, weight in totals.items()}
+
+
+class ClarificationType(StrEnum):
     """Types of clarifications supported by Portia"""
     INPUT = "input"
     MULTIPLE_CHOICE = "multiple_choice" 
@@ -64,7 +176,7 @@ class ClarificationType(Enum):
     CUSTOM = "custom"
 
 
-class ClarificationPriority(Enum):
+class ClarificationPriority(StrEnum):
     """Priority levels for clarifications"""
     LOW = "low"
     MEDIUM = "medium"
@@ -72,7 +184,11 @@ class ClarificationPriority(Enum):
     CRITICAL = "critical"
 
 
-class ClarificationStatus(Enum):
+# Ordinal rank of each priority; the enum values are strings and do not sort by urgency
+_PRIORITY_RANK = MappingProxyType({priority: rank for rank, priority in enumerate(ClarificationPriority)})
+
+
+class ClarificationStatus(StrEnum):
     """Status states for clarification requests"""
     PENDING = "pending"
     IN_PROGRESS = "in_progress"
@@ -81,7 +197,7 @@ class ClarificationStatus(Enum):
     EXPIRED = "expired"
 
 
-class ConflictType(Enum):
+class ConflictType(StrEnum):
     """Types of evidence conflicts that trigger clarification"""
     CONTRADICTORY_SOURCES = "contradictory_sources"
     CONFLICTING_FACTS = "conflicting_facts"
@@ -90,7 +206,7 @@ class ConflictType(Enum):
     METHODOLOGY_CONFLICT = "methodology_conflict"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ConfidenceMetrics:
     """Confidence scoring metrics for evidence and decisions"""
     overall_confidence: float
@@ -99,10 +215,21 @@ class ConfidenceMetrics:
     temporal_consistency: float
     cross_reference_score: float
     methodology_score: float
+    _lowest_metric: Tuple[str, float] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, "_lowest_metric", min(self.to_dict().items(), key=lambda x: x[1]))
     
     def to_dict(self) -> Dict[str, float]:
         """Convert to dictionary"""
-        return asdict(self)
+        return {
+            "overall_confidence": self.overall_confidence,
+            "source_reliability": self.source_reliability,
+            "fact_verification": self.fact_verification,
+            "temporal_consistency": self.temporal_consistency,
+            "cross_reference_score": self.cross_reference_score,
+            "methodology_score": self.methodology_score,
+        }
     
     def is_low_confidence(self, threshold: float = 0.7) -> bool:
         """Check if overall confidence is below threshold"""
@@ -110,11 +237,16 @@ class ConfidenceMetrics:
     
     def get_lowest_scoring_metric(self) -> Tuple[str, float]:
         """Get the metric with the lowest score"""
-        metrics = self.to_dict()
-        return min(metrics.items(), key=lambda x: x[1])
+        return self._lowest_metric
 
 
-@dataclass
+@lru_cache(maxsize=4096)
+def _epoch_to_iso(timestamp: float) -> str:
+    """Render epoch seconds as an ISO 8601 UTC timestamp; cached since records are exported repeatedly"""
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat()
+
+
+@dataclass(slots=True)
 class EvidenceConflict:
     """Represents a conflict between pieces of evidence"""
     conflict_id: str
@@ -122,18 +254,38 @@ class EvidenceConflict:
     conflicting_sources: List[Dict[str, Any]]
     conflict_description: str
     severity: float  # 0.0 to 1.0
-    detected_at: datetime
+    detected_at: float = field(default_factory=time.time)  # Epoch seconds
     resolution_required: bool = True
+    # Lazily built by option_ids; the leading underscore keeps it out of orjson output
+    _option_ids: Optional[Tuple[str, ...]] = field(default=None, init=False, repr=False, compare=False)
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary"""
-        result = asdict(self)
-        result['conflict_type'] = self.conflict_type.value
-        result['detected_at'] = self.detected_at.isoformat()
-        return result
+    @property
+    def option_ids(self) -> Tuple[str, ...]:
+        """Resolution option IDs, one per conflicting source"""
+        if self._option_ids is None:
+            self._option_ids = tuple(
+                f"source_{self.conflict_id}_{i}" for i in range(len(self.conflicting_sources))
+            )
+        return self._option_ids
+    
+    def to_dict(self, iso: bool = True) -> Dict[str, Any]:
+        """Convert to dictionary, with ISO 8601 timestamps unless iso is False"""
+        return {
+            "conflict_id": self.conflict_id,
+            "conflict_type": self.conflict_type,
+            "conflicting_sources": self.conflicting_sources,
+            "conflict_description": self.conflict_description,
+            "severity": self.severity,
+            "detected_at": _epoch_to_iso(self.detected_at) if iso else self.detected_at,
+            "resolution_required": self.resolution_required,
+        }
+    
+    def to_json_bytes(self) -> bytes:
+        """Serialize to JSON, with the same ISO 8601 timestamps as to_dict"""
+        return orjson.dumps(self.to_dict())
 
 
-@dataclass
+@dataclass(slots=True)
 class ClarificationRequest:
     """A request for human clarification"""
     request_id: str
@@ -148,31 +300,59 @@ class ClarificationRequest:
     options: Optional[List[Dict[str, Any]]] = None
     default_value: Optional[Any] = None
     timeout_seconds: Optional[int] = None
-    created_at: datetime = None
-    updated_at: datetime = None
+    created_at: float = field(default_factory=time.time)  # Epoch seconds
+    updated_at: Optional[float] = None
     response: Optional[Dict[str, Any]] = None
     response_user_id: Optional[str] = None
+    # Lazily built by options_by_source; the leading underscore keeps it out of orjson output
+    _options_index: Optional[Dict[str, Dict[str, Any]]] = field(default=None, init=False, repr=False, compare=False)
+    # Monotonic creation time for measuring response time, immune to wall-clock jumps
+    _monotonic_created: float = field(default_factory=time.monotonic, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Initialize timestamps"""
-        if self.created_at is None:
-            self.created_at = datetime.now(timezone.utc)
         if self.updated_at is None:
             self.updated_at = self.created_at
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary"""
-        result = asdict(self)
-        result['clarification_type'] = self.clarification_type.value
-        result['priority'] = self.priority.value
-        result['status'] = self.status.value
-        result['agent_type'] = self.agent_type.value
-        result['created_at'] = self.created_at.isoformat()
-        result['updated_at'] = self.updated_at.isoformat()
-        return result
+    @property
+    def options_by_source(self) -> Dict[str, Dict[str, Any]]:
+        """Source-backed options keyed by source name, keeping the first option per source"""
+        if self._options_index is None:
+            index = {}
+            for option in self.options or ():
+                data = option.get("data")
+                if isinstance(data, dict) and "source" in data:
+                    index.setdefault(data["source"], option)
+            self._options_index = index
+        return self._options_index
+    
+    def to_dict(self, iso: bool = True) -> Dict[str, Any]:
+        """Convert to dictionary, with ISO 8601 timestamps unless iso is False"""
+        return {
+            "request_id": self.request_id,
+            "clarification_type": self.clarification_type,
+            "priority": self.priority,
+            "status": self.status,
+            "claim_id": self.claim_id,
+            "agent_type": self.agent_type.value,
+            "title": self.title,
+            "description": self.description,
+            "context": self.context,
+            "options": self.options,
+            "default_value": self.default_value,
+            "timeout_seconds": self.timeout_seconds,
+            "created_at": _epoch_to_iso(self.created_at) if iso else self.created_at,
+            "updated_at": _epoch_to_iso(self.updated_at) if iso else self.updated_at,
+            "response": self.response,
+            "response_user_id": self.response_user_id,
+        }
+    
+    def to_json_bytes(self) -> bytes:
+        """Serialize to JSON, with the same ISO 8601 timestamps as to_dict"""
+        return orjson.dumps(self.to_dict())
 
 
-@dataclass
+@dataclass(slots=True)
 class ClarificationResponse:
     """Response to a clarification request"""
     request_id: str
@@ -181,18 +361,23 @@ class ClarificationResponse:
     response_time_seconds: float
     confidence: Optional[float] = None
     notes: Optional[str] = None
-    timestamp: datetime = None
+    timestamp: float = field(default_factory=time.time)  # Epoch seconds
     
-    def __post_init__(self):
-        """Initialize timestamp"""
-        if self.timestamp is None:
-            self.timestamp = datetime.now(timezone.utc)
+    def to_dict(self, iso: bool = True) -> Dict[str, Any]:
+        """Convert to dictionary, with ISO 8601 timestamps unless iso is False"""
+        return {
+            "request_id": self.request_id,
+            "response_data": self.response_data,
+            "user_id": self.user_id,
+            "response_time_seconds": self.response_time_seconds,
+            "confidence": self.confidence,
+            "notes": self.notes,
+            "timestamp": _epoch_to_iso(self.timestamp) if iso else self.timestamp,
+        }
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary"""
-        result = asdict(self)
-        result['timestamp'] = self.timestamp.isoformat()
-        return result
+    def to_json_bytes(self) -> bytes:
+        """Serialize to JSON, with the same ISO 8601 timestamps as to_dict"""
+        return orjson.dumps(self.to_dict())
 
 
 class ClarificationDecisionEngine:
@@ -224,43 +409,59 @@ class ClarificationDecisionEngine:
     
     def should_request_clarification(self, confidence: ConfidenceMetrics,
                                    conflicts: List[EvidenceConflict],
-                                   agent_result: AgentResult) -> Tuple[bool, ClarificationPriority, str]:
+                                   agent_result: AgentResult,
+                                   full_reason: bool = True) -> Tuple[bool, ClarificationPriority, str]:
         """
         Determine if clarification is needed based on confidence and conflicts
         
+        With full_reason=False the checks stop as soon as HIGH priority is reached,
+        and the reason only lists what was found up to that point.
+        
         Returns:
             Tuple of (should_clarify, priority, reason)
         """
         reasons = []
         max_priority = ClarificationPriority.LOW
+        thresholds = self.config["confidence_thresholds"]
+        low_threshold = thresholds["low"]
         
         # Check confidence levels
-        if confidence.overall_confidence < self.config["confidence_thresholds"]["low"]:
+        if confidence.overall_confidence < low_threshold:
             reasons.append("Very low overall confidence")
             max_priority = ClarificationPriority.HIGH
-        elif confidence.overall_confidence < self.config["confidence_thresholds"]["medium"]:
+            if not full_reason:
+                return True, max_priority, reasons[0]
+        elif confidence.overall_confidence < thresholds["medium"]:
             reasons.append("Low overall confidence")
-            max_priority = max(max_priority, ClarificationPriority.MEDIUM, key=lambda x: x.value)
+            max_priority = ClarificationPriority.MEDIUM
         
         # Check for low-scoring individual metrics
         lowest_metric, lowest_score = confidence.get_lowest_scoring_metric()
-        if lowest_score < self.config["confidence_thresholds"]["low"]:
+        if lowest_score < low_threshold:
             reasons.append(f"Low {lowest_metric} score: {lowest_score:.2f}")
-            max_priority = max(max_priority, ClarificationPriority.MEDIUM, key=lambda x: x.value)
+            if max_priority is ClarificationPriority.LOW:
+                max_priority = ClarificationPriority.MEDIUM
         
-        # Check conflicts
-        high_severity_conflicts = [c for c in conflicts if c.severity > self.config["conflict_severity_threshold"]]
-        if high_severity_conflicts:
-            reasons.append(f"High severity conflicts detected: {len(high_severity_conflicts)}")
+        # Check conflicts; a count is enough for the reason
+        high_severity_count = 0
+        if conflicts:
+            severity_threshold = self.config["conflict_severity_threshold"]
+            high_severity_count = sum(1 for c in conflicts if c.severity > severity_threshold)
+        if high_severity_count:
+            reasons.append(f"High severity conflicts detected: {high_severity_count}")
             max_priority = ClarificationPriority.HIGH
+            if not full_reason:
+                return True, max_priority, "; ".join(reasons)
         elif conflicts:
             reasons.append(f"Evidence conflicts detected: {len(conflicts)}")
-            max_priority = max(max_priority, ClarificationPriority.MEDIUM, key=lambda x: x.value)
+            if max_priority is ClarificationPriority.LOW:
+                max_priority = ClarificationPriority.MEDIUM
         
         # Check agent-specific errors
         if not agent_result.success and agent_result.error:
             reasons.append(f"Agent execution failed: {agent_result.error}")
-            max_priority = max(max_priority, ClarificationPriority.MEDIUM, key=lambda x: x.value)
+            if max_priority is ClarificationPriority.LOW:
+                max_priority = ClarificationPriority.MEDIUM
         
         should_clarify = len(reasons) > 0
         reason = "; ".join(reasons) if reasons else "No clarification needed"
@@ -269,7 +470,35 @@ class ClarificationDecisionEngine:
     
     def get_timeout_for_priority(self, priority: ClarificationPriority) -> int:
         """Get timeout in seconds for given priority"""
-        return self.config["timeout_defaults"][priority.value]
+        return self.config["timeout_defaults"][priority]
+
+
+# Marks a context field that is absent, as distinct from one set to None
+_MISSING = object()
+
+
+@lru_cache(maxsize=512)
+def _format_context_summary(claim_id: Any, agent_type: Any, overall_confidence: Any,
+                            conflict_count: Any, source_count: Any) -> str:
+    """Build the one-line context summary from its fingerprint; _MISSING fields are left out"""
+    formatted_parts = []
+    
+    if claim_id is not _MISSING:
+        formatted_parts.append(f"Claim ID: {claim_id}")
+    
+    if agent_type is not _MISSING:
+        formatted_parts.append(f"Agent: {agent_type}")
+    
+    if overall_confidence is not _MISSING:
+        formatted_parts.append(f"Overall Confidence: {overall_confidence:.2f}")
+    
+    if conflict_count is not _MISSING:
+        formatted_parts.append(f"Evidence Conflicts: {conflict_count}")
+    
+    if source_count is not _MISSING:
+        formatted_parts.append(f"Sources Analyzed: {source_count}")
+    
+    return " | ".join(formatted_parts) if formatted_parts else "Context available in details."
 
 
 class ClarificationPromptFormatter:
@@ -360,81 +589,207 @@ class ClarificationPromptFormatter:
         if not context:
             return "No additional context available."
         
-        formatted_parts = []
-        
-        if "claim_id" in context:
-            formatted_parts.append(f"Claim ID: {context['claim_id']}")
-        
-        if "agent_type" in context:
-            formatted_parts.append(f"Agent: {context['agent_type']}")
-        
+        # Reduce the context to the hashable fields shown in the summary
+        overall = _MISSING
         if "confidence_metrics" in context:
             metrics = context["confidence_metrics"]
             if isinstance(metrics, dict):
-                overall = metrics.get("overall_confidence", 0)
-                formatted_parts.append(f"Overall Confidence: {overall:.2f}")
-        
-        if "conflicts" in context and context["conflicts"]:
-            conflict_count = len(context["conflicts"])
-            formatted_parts.append(f"Evidence Conflicts: {conflict_count}")
-        
-        if "sources" in context:
-            source_count = len(context["sources"])
-            formatted_parts.append(f"Sources Analyzed: {source_count}")
-        
-        return " | ".join(formatted_parts) if formatted_parts else "Context available in details."
+                overall = round(metrics.get("overall_confidence", 0), 2)
+        
+        fingerprint = (
+            context.get("claim_id", _MISSING),
+            context.get("agent_type", _MISSING),
+            overall,
+            len(context["conflicts"]) if context.get("conflicts") else _MISSING,
+            len(context["sources"]) if "sources" in context else _MISSING
+        )
+        try:
+            return _format_context_summary(*fingerprint)
+        except TypeError:
+            # Unhashable claim or agent identifiers are formatted without caching
+            return _format_context_summary.__wrapped__(*fingerprint)
+
+
+# Evidence count from which detect_conflicts_async moves detection off the event loop
+_THREADED_DETECTION_MIN_EVIDENCE = 500
+
+# Evidence conflicts are re-detected for identical evidence at most every five minutes
+_CONFLICT_CACHE_SIZE = 256
+_CONFLICT_CACHE_TTL = 300
+
+# Evidence is fingerprinted by its content, whatever order its keys were inserted in
+_FINGERPRINT_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SORT_KEYS
 
 
 class ConflictDetector:
     """Detects conflicts in evidence and analysis results"""
     
+    # Verdicts that take a definite side on a claim
+    _DECISIVE_VERDICTS = frozenset(("true", "false", "verified", "disputed"))
+    
+    # Each contradictory agent verdict mapped to its opposite, in both directions
+    _OPPOSITE_VERDICTS = MappingProxyType({
+        "true": "false", "false": "true",
+        "verified": "disputed", "disputed": "verified",
+        "confirmed": "denied", "denied": "confirmed",
+        "valid": "invalid", "invalid": "valid"
+    })
+    
     def __init__(self):
         self.logger = logging.getLogger("clarification.conflict_detector")
+        self._conflict_cache: TTLCache = TTLCache(maxsize=_CONFLICT_CACHE_SIZE, ttl=_CONFLICT_CACHE_TTL)
+        # detect_conflicts_async reaches the memo from a worker thread
+        self._conflict_cache_lock = threading.Lock()
+    
+    @staticmethod
+    def _fingerprint(evidence_list: List[Dict[str, Any]]) -> Optional[bytes]:
+        """Content hash of the evidence, or None when it cannot be serialized"""
+        try:
+            payload = orjson.dumps(evidence_list, option=_FINGERPRINT_OPTIONS)
+        except TypeError:
+            return None
+        # BLAKE2b is fast and collision resistance is not a security concern here
+        return hashlib.blake2b(payload, digest_size=16).digest()
+    
+    def clear_cache(self):
+        """Forget memoized conflicts, e.g. once a human response may change how evidence is read"""
+        with self._conflict_cache_lock:
+            self._conflict_cache.clear()
+    
+    def _cached_conflicts(self, key: Optional[bytes]) -> Optional[List[EvidenceConflict]]:
+        """Fresh copies of the conflicts memoized under a fingerprint, if any
+        
+        Each copy gets a new ID and detection time, so claims sharing evidence never share conflicts.
+        """
+        if key is None:
+            return None
+        with self._conflict_cache_lock:
+            cached = self._conflict_cache.get(key)
+        if cached is None:
+            return None
+        now = time.time()
+        return [
+            self._copy_conflict(conflict, conflict_id=str(uuid.uuid4()), detected_at=now)
+            for conflict in cached
+        ]
+    
+    def _remember_conflicts(self, key: Optional[bytes], conflicts: List[EvidenceConflict]):
+        """Memoize copies of conflicts under a fingerprint, unless the inputs could not be fingerprinted"""
+        if key is not None:
+            cached = tuple(self._copy_conflict(conflict) for conflict in conflicts)
+            with self._conflict_cache_lock:
+                self._conflict_cache[key] = cached
+    
+    @staticmethod
+    def _copy_conflict(conflict: EvidenceConflict, **changes: Any) -> EvidenceConflict:
+        """Copy a conflict and its source entries, so the memo never shares them with callers"""
+        return replace(
+            conflict,
+            conflicting_sources=[dict(source) for source in conflict.conflicting_sources],
+            **changes
+        )
+    
+    @staticmethod
+    def build_indices(evidence_list: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Group evidence in one pass for the contradiction and credibility checks
+        
+        Callers checking the same evidence repeatedly can build this once and
+        pass it to detect_conflicts as prebuilt_indices.
+        """
+        by_claim = defaultdict(list)
+        verdict_counts = defaultdict(Counter)
+        by_source = defaultdict(list)
+        for evidence in evidence_list:
+            claim = evidence.get("claim", "unknown")
+            by_claim[claim].append(evidence)
+            if "verdict" in evidence:
+                verdict_counts[claim][evidence.get("verdict", "unknown").lower()] += 1
+                
+            source = evidence.get("source_url", evidence.get("source", "unknown"))
+            if source and "credibility_score" in evidence:
+                by_source[source].append(evidence)
+                
+        return {"by_claim": by_claim, "verdict_counts": verdict_counts, "by_source": by_source}
     
     def detect_conflicts(self, evidence_list: List[Dict[str, Any]],
-                        agent_results: Dict[str, AgentResult]) -> List[EvidenceConflict]:
-        """Detect conflicts in evidence and agent results"""
+                        agent_results: Dict[str, AgentResult],
+                        prebuilt_indices: Optional[Dict[str, Dict[str, Any]]] = None) -> List[EvidenceConflict]:
+        """
+        Detect conflicts in evidence and agent results
+        
+        Evidence conflicts are memoized by a content hash of the evidence. Methodology
+        conflicts are cheap and always checked against the current agent results.
+        """
+        conflicts = self._detect_evidence_conflicts(evidence_list, prebuilt_indices)
+        
+        # Detect methodology conflicts
+        conflicts.extend(self._detect_methodology_conflicts(agent_results))
+        return conflicts
+    
+    def _detect_evidence_conflicts(self, evidence_list: List[Dict[str, Any]],
+                                   prebuilt_indices: Optional[Dict[str, Dict[str, Any]]] = None) -> List[EvidenceConflict]:
+        """Evidence conflicts from the memo, or from the detectors on a miss"""
+        key = self._fingerprint(evidence_list)
+        conflicts = self._cached_conflicts(key)
+        if conflicts is None:
+            conflicts = self._run_evidence_detectors(evidence_list, prebuilt_indices)
+            self._remember_conflicts(key, conflicts)
+        return conflicts
+    
+    def _run_evidence_detectors(self, evidence_list: List[Dict[str, Any]],
+                                prebuilt_indices: Optional[Dict[str, Dict[str, Any]]] = None) -> List[EvidenceConflict]:
+        """Run every evidence conflict detector in turn"""
         conflicts = []
+        indices = prebuilt_indices or self.build_indices(evidence_list)
         
         # Detect contradictory sources
-        conflicts.extend(self._detect_source_contradictions(evidence_list))
+        conflicts.extend(self._detect_source_contradictions(indices))
         
         # Detect conflicting facts
         conflicts.extend(self._detect_fact_conflicts(evidence_list))
         
         # Detect credibility disputes
-        conflicts.extend(self._detect_credibility_conflicts(evidence_list))
+        conflicts.extend(self._detect_credibility_conflicts(indices))
         
         # Detect temporal inconsistencies
         conflicts.extend(self._detect_temporal_conflicts(evidence_list))
         
-        # Detect methodology conflicts
-        conflicts.extend(self._detect_methodology_conflicts(agent_results))
+        return conflicts
+    
+    async def detect_conflicts_async(self, evidence_list: List[Dict[str, Any]],
+                                     agent_results: Dict[str, AgentResult],
+                                     prebuilt_indices: Optional[Dict[str, Dict[str, Any]]] = None) -> List[EvidenceConflict]:
+        """
+        Detect conflicts without blocking the event loop on large evidence lists
         
+        The detectors are pure Python, so threads cannot run them in parallel; large
+        lists are checked in a single worker thread instead, which keeps the loop
+        responsive. Small lists are checked inline, where the hand-off would cost more
+        than it saves. Conflicts come back in the same order as detect_conflicts, and
+        share its memo.
+        """
+        if len(evidence_list) < _THREADED_DETECTION_MIN_EVIDENCE:
+            conflicts = self._detect_evidence_conflicts(evidence_list, prebuilt_indices)
+        else:
+            conflicts = await asyncio.to_thread(self._detect_evidence_conflicts, evidence_list, prebuilt_indices)
+            
+        conflicts.extend(self._detect_methodology_conflicts(agent_results))
         return conflicts
     
-    def _detect_source_contradictions(self, evidence_list: List[Dict[str, Any]]) -> List[EvidenceConflict]:
+    def _detect_source_contradictions(self, indices: Dict[str, Dict[str, Any]]) -> List[EvidenceConflict]:
         """Detect contradictory information from different sources"""
         conflicts = []
         
-        # Group evidence by claim/topic
-        claim_groups = {}
-        for evidence in evidence_list:
-            claim = evidence.get("claim", "unknown")
-            if claim not in claim_groups:
-                claim_groups[claim] = []
-            claim_groups[claim].append(evidence)
-        
-        # Check for contradictions within each claim group
-        for claim, group in claim_groups.items():
+        # Check for contradictions within each claim/topic group
+        for claim, group in indices["by_claim"].items():
             if len(group) < 2:
                 continue
                 
             # Look for opposing verdicts
-            verdicts = [e.get("verdict", "unknown").lower() for e in group if "verdict" in e]
-            unique_verdicts = set(verdicts)
+            unique_verdicts = set(indices["verdict_counts"].get(claim, ()))
             
-            if len(unique_verdicts) > 1 and any(v in ["true", "false", "verified", "disputed"] for v in unique_verdicts):
+            if len(unique_verdicts) > 1 and not unique_verdicts.isdisjoint(self._DECISIVE_VERDICTS):
                 conflicting_sources = [
                     {
                         "source": e.get("source", "unknown"),
@@ -449,8 +804,7 @@ class ConflictDetector:
                     conflict_type=ConflictType.CONTRADICTORY_SOURCES,
                     conflicting_sources=conflicting_sources,
                     conflict_description=f"Sources provide contradictory verdicts for claim: {claim}",
-                    severity=self._calculate_contradiction_severity(conflicting_sources),
-                    detected_at=datetime.now(timezone.utc)
+                    severity=self._calculate_contradiction_severity(conflicting_sources)
                 )
                 conflicts.append(conflict)
         
@@ -460,58 +814,46 @@ class ConflictDetector:
         """Detect conflicts in factual claims"""
         conflicts = []
         
-        # Look for numerical discrepancies
-        numerical_claims = {}
+        # Look for numerical discrepancies, keeping values apart from their sources
+        values_by_key: Dict[str, List[float]] = defaultdict(list)
+        meta_by_key: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
         for evidence in evidence_list:
             if "facts" in evidence and isinstance(evidence["facts"], dict):
                 for fact_key, fact_value in evidence["facts"].items():
                     if isinstance(fact_value, (int, float)):
-                        if fact_key not in numerical_claims:
-                            numerical_claims[fact_key] = []
-                        numerical_claims[fact_key].append({
+                        values_by_key[fact_key].append(fact_value)
+                        meta_by_key[fact_key].append({
                             "value": fact_value,
                             "source": evidence.get("source", "unknown"),
                             "evidence": evidence
                         })
         
         # Check for significant discrepancies
-        for fact_key, values in numerical_claims.items():
-            if len(values) < 2:
+        for fact_key, nums in values_by_key.items():
+            if len(nums) < 2:
                 continue
                 
-            nums = [v["value"] for v in values]
-            mean_val = statistics.mean(nums)
-            std_dev = statistics.stdev(nums) if len(nums) > 1 else 0
+            mean_val, std_dev = _fact_spread(nums)
             
             # Flag if standard deviation is more than 20% of mean
             if std_dev > (mean_val * 0.2):
                 conflict = EvidenceConflict(
                     conflict_id=str(uuid.uuid4()),
                     conflict_type=ConflictType.CONFLICTING_FACTS,
-                    conflicting_sources=values,
+                    conflicting_sources=meta_by_key[fact_key],
                     conflict_description=f"Significant discrepancy in numerical fact '{fact_key}': {nums}",
-                    severity=min(std_dev / mean_val, 1.0) if mean_val != 0 else 1.0,
-                    detected_at=datetime.now(timezone.utc)
+                    severity=min(std_dev / mean_val, 1.0) if mean_val != 0 else 1.0
                 )
                 conflicts.append(conflict)
         
         return conflicts
     
-    def _detect_credibility_conflicts(self, evidence_list: List[Dict[str, Any]]) -> List[EvidenceConflict]:
+    def _detect_credibility_conflicts(self, indices: Dict[str, Dict[str, Any]]) -> List[EvidenceConflict]:
         """Detect conflicts in source credibility assessments"""
         conflicts = []
         
-        # Group by source URL/domain
-        source_credibility = {}
-        for evidence in evidence_list:
-            source = evidence.get("source_url", evidence.get("source", "unknown"))
-            if source and "credibility_score" in evidence:
-                if source not in source_credibility:
-                    source_credibility[source] = []
-                source_credibility[source].append(evidence)
-        
-        # Check for credibility score discrepancies
-        for source, assessments in source_credibility.items():
+        # Check for credibility score discrepancies within each source URL/domain
+        for source, assessments in indices["by_source"].items():
             if len(assessments) < 2:
                 continue
                 
@@ -525,8 +867,7 @@ class ConflictDetector:
                     conflict_type=ConflictType.CREDIBILITY_DISPUTE,
                     conflicting_sources=assessments,
                     conflict_description=f"Credibility scores for '{source}' vary significantly: {scores}",
-                    severity=min(score_range, 1.0),
-                    detected_at=datetime.now(timezone.utc)
+                    severity=min(score_range, 1.0)
                 )
                 conflicts.append(conflict)
         
@@ -536,28 +877,30 @@ class ConflictDetector:
         """Detect temporal inconsistencies in evidence"""
         conflicts = []
         
-        # Look for timeline inconsistencies
+        # Look for timeline inconsistencies, noting repeated dates in the same pass
         temporal_claims = []
+        seen_dates = set()
+        duplicate_date = False
         for evidence in evidence_list:
             if "timeline" in evidence or "date" in evidence:
                 temporal_claims.append(evidence)
+                if not duplicate_date and "date" in evidence:
+                    date = evidence["date"]
+                    if date in seen_dates:
+                        duplicate_date = True
+                    else:
+                        seen_dates.add(date)
         
         # Simple check for contradictory dates
         if len(temporal_claims) >= 2:
-            dates = []
-            for claim in temporal_claims:
-                if "date" in claim:
-                    dates.append(claim["date"])
-            
             # This is a simplified check - in practice would need more sophisticated temporal reasoning
-            if len(set(dates)) != len(dates):  # Duplicate dates for potentially conflicting events
+            if duplicate_date:  # Duplicate dates for potentially conflicting events
                 conflict = EvidenceConflict(
                     conflict_id=str(uuid.uuid4()),
                     conflict_type=ConflictType.TEMPORAL_INCONSISTENCY,
                     conflicting_sources=temporal_claims,
                     conflict_description="Temporal inconsistencies detected in evidence timeline",
-                    severity=0.6,
-                    detected_at=datetime.now(timezone.utc)
+                    severity=0.6
                 )
                 conflicts.append(conflict)
         
@@ -581,18 +924,14 @@ class ConflictDetector:
         
         # Check for conflicting verdicts between agents
         verdict_values = [v["verdict"] for v in verdicts.values()]
-        unique_verdicts = set([str(v).lower() for v in verdict_values])
+        unique_verdicts = set(str(v).lower() for v in verdict_values)
         
         if len(unique_verdicts) > 1:
             # Check if contradictory (true/false, verified/disputed, etc.)
-            contradictory_pairs = [
-                ("true", "false"), ("verified", "disputed"), 
-                ("confirmed", "denied"), ("valid", "invalid")
-            ]
-            
+            opposites = self._OPPOSITE_VERDICTS
             is_contradictory = any(
-                pair[0] in unique_verdicts and pair[1] in unique_verdicts
-                for pair in contradictory_pairs
+                v in opposites and opposites[v] in unique_verdicts
+                for v in unique_verdicts
             )
             
             if is_contradictory:
@@ -601,8 +940,7 @@ class ConflictDetector:
                     conflict_type=ConflictType.METHODOLOGY_CONFLICT,
                     conflicting_sources=list(verdicts.values()),
                     conflict_description="Different analysis methods reached contradictory conclusions",
-                    severity=0.8,
-                    detected_at=datetime.now(timezone.utc)
+                    severity=0.8
                 )
                 conflicts.append(conflict)
         
@@ -614,35 +952,142 @@ class ConflictDetector:
             return 0.0
         
         confidences = [s.get("confidence", 0.5) for s in conflicting_sources]
-        avg_confidence = statistics.mean(confidences)
         
         # Higher average confidence in contradictory sources = higher severity
+        avg_confidence = sum(confidences) / len(confidences)
         return min(avg_confidence * 1.2, 1.0)
 
 
+# Most audit events written per batch, and how long a partial batch waits for more
+_AUDIT_BATCH_SIZE = 64
+_AUDIT_FLUSH_INTERVAL = 0.1
+
+# Records streamed between event-loop yields in stream_clarification_audit
+_AUDIT_STREAM_YIELD_EVERY = 256
+
+
+# Terminal statuses; a request in one of these is no longer active
+_FINISHED_STATUSES = frozenset((ClarificationStatus.COMPLETED, ClarificationStatus.CANCELLED,
+                                ClarificationStatus.EXPIRED))
+
+
 class ClarificationStateTracker:
     """Tracks state and provides audit trails for clarification requests"""
     
     def __init__(self, audit_manager: AuditManager):
         self.audit_manager = audit_manager
-        self.active_requests: Dict[str, ClarificationRequest] = {}
-        self.completed_requests: Dict[str, ClarificationRequest] = {}
+        self.requests_by_id: Dict[str, ClarificationRequest] = {}
         self.request_responses: Dict[str, ClarificationResponse] = {}
+        # Request ids per status, moved between sets on every transition
+        self._by_status: Dict[ClarificationStatus, set] = {status: set() for status in ClarificationStatus}
+        # Secondary indices so per-claim and pending lookups avoid full scans
+        self._by_claim: Dict[str, List[ClarificationRequest]] = defaultdict(list)
+        # Pending min-heap of (-priority rank, created_at, request_id) with lazy deletion:
+        # an entry is live only while it is the one recorded for its request in _pending_entries
+        self._pending_heap: List[Tuple[int, float, str]] = []
+        self._pending_entries: Dict[str, Tuple[int, float, str]] = {}
+        # Min-heap of (expiry epoch, request_id); entries for finished requests are skipped on pop
+        self._expiry_heap: List[Tuple[float, str]] = []
+        # Set when a request is tracked that expires before every earlier one
+        self.expiry_scheduled = asyncio.Event()
+        # Audit events are queued and written in batches by a background flusher
+        self._audit_queue: asyncio.Queue = asyncio.Queue()
+        self._audit_flusher_task: Optional[asyncio.Task] = None
         self.logger = logging.getLogger("clarification.state_tracker")
     
+    def _log_audit_event(self, **event):
+        """Queue an audit event, or log it directly when no event loop is running"""
+        event["timestamp"] = datetime.now(timezone.utc)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            self.audit_manager.log_events_batch([event])
+            return
+            
+        self._audit_queue.put_nowait(event)
+        if self._audit_flusher_task is None or self._audit_flusher_task.done():
+            self._audit_flusher_task = asyncio.create_task(self._audit_flusher())
+    
+    async def _audit_flusher(self):
+        """Write queued audit events in batches of up to _AUDIT_BATCH_SIZE"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = []
+            try:
+                batch.append(await self._audit_queue.get())
+                deadline = loop.time() + _AUDIT_FLUSH_INTERVAL
+                while len(batch) < _AUDIT_BATCH_SIZE:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._audit_queue.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
+            except asyncio.CancelledError:
+                # Keep events already taken off the queue when shutting down
+                self._write_audit_batch(batch)
+                raise
+                
+            self._write_audit_batch(batch)
+    
+    def _write_audit_batch(self, batch: List[Dict[str, Any]]):
+        """Hand a batch of dequeued events to the audit manager"""
+        if not batch:
+            return
+        try:
+            self.audit_manager.log_events_batch(batch)
+        except Exception as e:
+            self.logger.error(f"Error writing audit batch: {e}", exc_info=True)
+        finally:
+            for _ in batch:
+                self._audit_queue.task_done()
+    
+    def _drain_audit_queue(self):
+        """Write every event still waiting in the queue"""
+        batch = []
+        while not self._audit_queue.empty():
+            batch.append(self._audit_queue.get_nowait())
+        self._write_audit_batch(batch)
+    
+    async def flush_audit_events(self):
+        """Write queued audit events now, including a batch the flusher is still collecting"""
+        self._drain_audit_queue()
+        await self._audit_queue.join()
+    
+    async def aclose(self):
+        """Stop the audit flusher and write out anything still queued"""
+        if self._audit_flusher_task is not None:
+            self._audit_flusher_task.cancel()
+            try:
+                await self._audit_flusher_task
+            except asyncio.CancelledError:
+                pass
+            self._audit_flusher_task = None
+        self._drain_audit_queue()
+    
     def track_request(self, request: ClarificationRequest):
         """Add a clarification request to tracking"""
-        self.active_requests[request.request_id] = request
+        self.requests_by_id[request.request_id] = request
+        self._by_status[request.status].add(request.request_id)
+        self._by_claim[request.claim_id].append(request)
+        if request.status == ClarificationStatus.PENDING:
+            self._push_pending(request)
+        if request.timeout_seconds:
+            expiry = request.created_at + request.timeout_seconds
+            heapq.heappush(self._expiry_heap, (expiry, request.request_id))
+            if self._expiry_heap[0][1] == request.request_id:
+                self.expiry_scheduled.set()
         
         # Log to audit trail
-        self.audit_manager.log_event(
+        self._log_audit_event(
             agent_type=request.agent_type,
             event_type="clarification_requested",
             claim_id=request.claim_id,
             data={
                 "request_id": request.request_id,
-                "clarification_type": request.clarification_type.value,
-                "priority": request.priority.value,
+                "clarification_type": request.clarification_type,
+                "priority": request.priority,
                 "title": request.title
             }
         )
@@ -652,42 +1097,49 @@ class ClarificationStateTracker:
     def update_request_status(self, request_id: str, new_status: ClarificationStatus,
                             user_id: Optional[str] = None):
         """Update the status of a clarification request"""
-        if request_id in self.active_requests:
-            request = self.active_requests[request_id]
+        if self.is_active(request_id):
+            request = self.requests_by_id[request_id]
             old_status = request.status
             request.status = new_status
-            request.updated_at = datetime.now(timezone.utc)
+            request.updated_at = time.time()
+            self._by_status[old_status].discard(request_id)
+            self._by_status[new_status].add(request_id)
+            
+            if old_status == ClarificationStatus.PENDING and new_status != ClarificationStatus.PENDING:
+                self._drop_pending(request_id)
+            elif new_status == ClarificationStatus.PENDING and old_status != ClarificationStatus.PENDING:
+                self._push_pending(request)
             
             # Log status change
-            self.audit_manager.log_event(
+            self._log_audit_event(
                 agent_type=request.agent_type,
                 event_type="clarification_status_changed",
                 claim_id=request.claim_id,
                 user_id=user_id,
                 data={
                     "request_id": request_id,
-                    "old_status": old_status.value,
-                    "new_status": new_status.value
+                    "old_status": old_status,
+                    "new_status": new_status
                 }
             )
             
-            # Move to completed if finished
-            if new_status in [ClarificationStatus.COMPLETED, ClarificationStatus.CANCELLED, ClarificationStatus.EXPIRED]:
-                self.completed_requests[request_id] = self.active_requests.pop(request_id)
+            # Finished requests no longer need their expiry deadline
+            if new_status in _FINISHED_STATUSES:
+                self._compact_expiry_heap()
     
     def record_response(self, response: ClarificationResponse):
         """Record a response to a clarification request"""
         self.request_responses[response.request_id] = response
         
         # Update request with response
-        if response.request_id in self.active_requests:
-            request = self.active_requests[response.request_id]
+        if self.is_active(response.request_id):
+            request = self.requests_by_id[response.request_id]
             request.response = response.response_data
             request.response_user_id = response.user_id
             self.update_request_status(response.request_id, ClarificationStatus.COMPLETED, response.user_id)
         
         # Log response
-        self.audit_manager.log_event(
+        self._log_audit_event(
             agent_type=DetectiveAgentType.ORCHESTRATOR,  # System event
             event_type="clarification_responded",
             user_id=response.user_id,
@@ -702,74 +1154,197 @@ class ClarificationStateTracker:
     
     def get_request_status(self, request_id: str) -> Optional[ClarificationRequest]:
         """Get current status of a clarification request"""
-        if request_id in self.active_requests:
-            return self.active_requests[request_id]
-        elif request_id in self.completed_requests:
-            return self.completed_requests[request_id]
-        return None
+        return self.requests_by_id.get(request_id)
+    
+    def is_active(self, request_id: str) -> bool:
+        """Whether a request is tracked and not yet completed, cancelled or expired"""
+        by_status = self._by_status
+        return request_id in by_status[ClarificationStatus.PENDING] or request_id in by_status[ClarificationStatus.IN_PROGRESS]
+    
+    def active_count(self) -> int:
+        """Number of tracked requests still pending or in progress"""
+        return len(self._by_status[ClarificationStatus.PENDING]) + len(self._by_status[ClarificationStatus.IN_PROGRESS])
     
     def get_claim_clarifications(self, claim_id: str) -> List[ClarificationRequest]:
         """Get all clarifications for a specific claim"""
-        claim_clarifications = []
-        
-        # Check active requests
-        for request in self.active_requests.values():
-            if request.claim_id == claim_id:
-                claim_clarifications.append(request)
-        
-        # Check completed requests
-        for request in self.completed_requests.values():
-            if request.claim_id == claim_id:
-                claim_clarifications.append(request)
+        claim_clarifications = self._by_claim.get(claim_id)
+        if not claim_clarifications:
+            return []
         
         # Sort by creation time
         return sorted(claim_clarifications, key=lambda x: x.created_at)
     
-    def get_pending_requests(self, user_id: Optional[str] = None) -> List[ClarificationRequest]:
-        """Get all pending clarification requests"""
-        pending = [r for r in self.active_requests.values() if r.status == ClarificationStatus.PENDING]
-        
-        # Sort by priority and creation time
-        return sorted(pending, key=lambda x: (x.priority.value, x.created_at))
+    def _push_pending(self, request: ClarificationRequest):
+        """Add a request to the pending heap"""
+        entry = (-_PRIORITY_RANK[request.priority], request.created_at, request.request_id)
+        self._pending_entries[request.request_id] = entry
+        heapq.heappush(self._pending_heap, entry)
+    
+    def _drop_pending(self, request_id: str):
+        """Retire a request's pending entry, compacting the heap once most entries are stale"""
+        if self._pending_entries.pop(request_id, None) is None:
+            return
+        if len(self._pending_heap) > 2 * len(self._pending_entries) + 32:
+            entries = self._pending_entries
+            self._pending_heap = [e for e in self._pending_heap if entries.get(e[2]) is e]
+            heapq.heapify(self._pending_heap)
+    
+    def get_pending_requests(self, user_id: Optional[str] = None,
+                             limit: Optional[int] = None) -> List[ClarificationRequest]:
+        """Get pending clarification requests, most urgent first and oldest first within a priority"""
+        heap = self._pending_heap
+        entries = self._pending_entries
+        
+        # Discard stale entries sitting on top of the heap
+        while heap and entries.get(heap[0][2]) is not heap[0]:
+            heapq.heappop(heap)
+        
+        if limit is None:
+            candidates = sorted(heap)
+        else:
+            # Over-fetch by the number of stale entries still buried in the heap
+            candidates = heapq.nsmallest(limit + len(heap) - len(entries), heap)
+            
+        pending = [self.requests_by_id[e[2]] for e in candidates if entries.get(e[2]) is e]
+        return pending if limit is None else pending[:limit]
     
     def cleanup_expired_requests(self, timeout_seconds: int = 3600):
         """Clean up expired clarification requests"""
-        current_time = datetime.now(timezone.utc)
-        expired_requests = []
-        
-        for request_id, request in self.active_requests.items():
-            if request.timeout_seconds:
-                expiry_time = request.created_at.timestamp() + request.timeout_seconds
-                if current_time.timestamp() > expiry_time:
-                    expired_requests.append(request_id)
-        
-        # Mark expired requests
-        for request_id in expired_requests:
-            self.update_request_status(request_id, ClarificationStatus.EXPIRED)
-            self.logger.warning(f"Clarification request {request_id} expired")
+        now = time.time()
+        heap = self._expiry_heap
+        
+        # Only requests whose deadline has passed are popped; the rest stay queued
+        while heap and heap[0][0] < now:
+            _, request_id = heapq.heappop(heap)
+            if self.is_active(request_id):
+                self.update_request_status(request_id, ClarificationStatus.EXPIRED)
+                self.logger.warning(f"Clarification request {request_id} expired")
+    
+    def seconds_until_next_expiry(self, default: Optional[float] = None) -> Optional[float]:
+        """Seconds until the earliest deadline of a still-active request, capped at default"""
+        heap = self._expiry_heap
+        # Drop deadlines of requests that finished before expiring
+        while heap and not self.is_active(heap[0][1]):
+            heapq.heappop(heap)
+        if not heap:
+            return default
+        remaining = max(heap[0][0] - time.time(), 0.0)
+        return remaining if default is None else min(remaining, default)
+    
+    def _compact_expiry_heap(self):
+        """Rebuild the expiry heap from active requests once finished ones dominate it"""
+        if len(self._expiry_heap) > 2 * self.active_count() + 32:
+            # Rebuilt in place so a sweep holding the list keeps a valid heap
+            self._expiry_heap[:] = [e for e in self._expiry_heap if self.is_active(e[1])]
+            heapq.heapify(self._expiry_heap)
     
     def export_clarification_audit(self, claim_id: Optional[str] = None) -> Dict[str, Any]:
         """Export clarification audit data"""
         if claim_id:
             requests = self.get_claim_clarifications(claim_id)
         else:
-            requests = list(self.active_requests.values()) + list(self.completed_requests.values())
+            requests = list(self.requests_by_id.values())
         
         # Get associated responses
         responses = []
         for request in requests:
             if request.request_id in self.request_responses:
-                responses.append(self.request_responses[request.request_id].to_dict())
+                responses.append(self.request_responses[request.request_id])
+        
+        if claim_id:
+            active_count = sum(1 for r in requests if r.status == ClarificationStatus.PENDING)
+            completed_count = sum(1 for r in requests if r.status == ClarificationStatus.COMPLETED)
+        else:
+            active_count = len(self._by_status[ClarificationStatus.PENDING])
+            completed_count = len(self._by_status[ClarificationStatus.COMPLETED])
         
         return {
             "export_timestamp": datetime.now(timezone.utc).isoformat(),
             "claim_id": claim_id,
             "request_count": len(requests),
             "requests": [r.to_dict() for r in requests],
-            "responses": responses,
-            "active_count": len([r for r in requests if r.status == ClarificationStatus.PENDING]),
-            "completed_count": len([r for r in requests if r.status == ClarificationStatus.COMPLETED])
+            "responses": [r.to_dict() for r in responses],
+            "active_count": active_count,
+            "completed_count": completed_count
         }
+    
+    def export_clarification_audit_json(self, claim_id: Optional[str] = None) -> bytes:
+        """Export clarification audit data as JSON, in the same shape as export_clarification_audit"""
+        return orjson.dumps(self.export_clarification_audit(claim_id))
+    
+    async def stream_clarification_audit(self, claim_id: Optional[str] = None) -> AsyncIterator[bytes]:
+        """
+        Stream clarification audit data as newline-delimited JSON
+        
+        The first line is a header with the export metadata and counts; it is
+        followed by request_count request lines and then response_count response
+        lines, each in the same shape as export_clarification_audit.
+        """
+        if claim_id:
+            requests = self.get_claim_clarifications(claim_id)
+        else:
+            requests = list(self.requests_by_id.values())
+        responses = self.request_responses
+        
+        active_count = completed_count = response_count = 0
+        for request in requests:
+            if request.status == ClarificationStatus.PENDING:
+                active_count += 1
+            elif request.status == ClarificationStatus.COMPLETED:
+                completed_count += 1
+            if request.request_id in responses:
+                response_count += 1
+        
+        yield orjson.dumps({
+            "export_timestamp": datetime.now(timezone.utc).isoformat(),
+            "claim_id": claim_id,
+            "request_count": len(requests),
+            "response_count": response_count,
+            "active_count": active_count,
+            "completed_count": completed_count
+        }, option=orjson.OPT_APPEND_NEWLINE)
+        
+        for i, request in enumerate(requests, 1):
+            yield request.to_json_bytes() + b"\n"
+            if i % _AUDIT_STREAM_YIELD_EVERY == 0:
+                await asyncio.sleep(0)  # Let other tasks run during large exports
+        
+        for i, request in enumerate(requests, 1):
+            response = responses.get(request.request_id)
+            if response is not None:
+                yield response.to_json_bytes() + b"\n"
+            if i % _AUDIT_STREAM_YIELD_EVERY == 0:
+                await asyncio.sleep(0)
+
+
+async def _capture_exception(coro):
+    """Await a coroutine, returning its exception instead of raising, as gather(return_exceptions=True) does"""
+    try:
+        return await coro
+    except Exception as e:
+        return e
+
+
+# Overall confidence bands that pick the clarification type when there are no conflicts
+_INPUT_CONFIDENCE_BELOW = 0.4
+_CONFIRMATION_CONFIDENCE_BELOW = 0.8
+
+# Templates for the options offered with every conflict resolution; each request gets its own copy
+_REQUEST_MORE_EVIDENCE_OPTION = {
+    "id": "request_more_evidence",
+    "label": "Request Additional Evidence",
+    "description": "Ask for more sources before making a decision",
+    "data": {"action": "request_more_evidence"}
+}
+_MANUAL_REVIEW_OPTION = {
+    "id": "manual_review",
+    "label": "Escalate for Manual Review",
+    "description": "Flag this claim for detailed manual investigation",
+    "data": {"action": "escalate"}
+}
+
+# Stand-in judged by the decision engine when a claim has no agent results
+_NO_AGENT_RESULT = AgentResult(agent_type=DetectiveAgentType.ORCHESTRATOR, success=True)
 
 
 class HumanInTheLoopClarificationSystem:
@@ -797,6 +1372,10 @@ class HumanInTheLoopClarificationSystem:
         # Start cleanup task
         self._start_cleanup_task()
     
+    async def aclose(self):
+        """Flush queued audit events from the state tracker"""
+        await self.state_tracker.aclose()
+    
     def register_clarification_callback(self, callback: Callable):
         """Register a callback function for when clarification is requested"""
         self.clarification_callbacks.append(callback)
@@ -811,11 +1390,11 @@ class HumanInTheLoopClarificationSystem:
         """
         try:
             # Detect conflicts in evidence
-            conflicts = self.conflict_detector.detect_conflicts(evidence_list, agent_results)
+            conflicts = await self.conflict_detector.detect_conflicts_async(evidence_list, agent_results)
             
-            # Decide if clarification is needed
+            # Decide if clarification is needed, judging by the first agent's result
             should_clarify, priority, reason = self.decision_engine.should_request_clarification(
-                confidence, conflicts, list(agent_results.values())[0] if agent_results else AgentResult(DetectiveAgentType.ORCHESTRATOR, True)
+                confidence, conflicts, next(iter(agent_results.values()), _NO_AGENT_RESULT)
             )
             
             if not should_clarify:
@@ -854,7 +1433,7 @@ class HumanInTheLoopClarificationSystem:
             raise ValueError(f"Clarification request {request_id} is not pending (status: {request.status.value})")
         
         # Calculate response time
-        response_time = (datetime.now(timezone.utc) - request.created_at).total_seconds()
+        response_time = time.monotonic() - request._monotonic_created
         
         # Create response
         response = ClarificationResponse(
@@ -868,6 +1447,7 @@ class HumanInTheLoopClarificationSystem:
         
         # Record response
         self.state_tracker.record_response(response)
+        self.conflict_detector.clear_cache()
         
         self.logger.info(f"Processed clarification response for {request_id} from user {user_id}")
         return response
@@ -881,19 +1461,25 @@ class HumanInTheLoopClarificationSystem:
         return self.state_tracker.get_claim_clarifications(claim_id)
     
     def calculate_confidence_metrics(self, evidence_list: List[Dict[str, Any]],
-                                   agent_results: Dict[str, AgentResult]) -> ConfidenceMetrics:
-        """Calculate confidence metrics from evidence and agent results"""
+                                   agent_results: Dict[str, AgentResult],
+                                   agent_consensus: Optional[float] = None) -> ConfidenceMetrics:
+        """
+        Calculate confidence metrics from evidence and agent results
+        
+        agent_consensus may carry a median agent confidence the caller already computed.
+        """
         # Source reliability
-        source_scores = [e.get("credibility_score", 0.5) for e in evidence_list if "credibility_score" in e]
-        source_reliability = statistics.mean(source_scores) if source_scores else 0.5
+        source_scores = [e["credibility_score"] for e in evidence_list if "credibility_score" in e]
+        source_reliability = sum(source_scores) / len(source_scores) if source_scores else 0.5
         
         # Fact verification
-        verified_facts = [e for e in evidence_list if e.get("verified", False)]
-        fact_verification = len(verified_facts) / len(evidence_list) if evidence_list else 0.5
+        verified_count = sum(1 for e in evidence_list if e.get("verified", False))
+        fact_verification = verified_count / len(evidence_list) if evidence_list else 0.5
         
-        # Agent confidence
-        agent_confidences = [r.confidence for r in agent_results.values() if r.confidence is not None]
-        agent_confidence = statistics.mean(agent_confidences) if agent_confidences else 0.5
+        # Agent confidence: the median is robust to a single outlying agent
+        if agent_consensus is None:
+            agent_consensus, _ = agent_confidence_consensus(agent_results)
+        agent_confidence = agent_consensus
         
         # Temporal consistency (simplified)
         temporal_consistency = 0.8  # Would be more sophisticated in practice
@@ -932,12 +1518,14 @@ class HumanInTheLoopClarificationSystem:
         if conflicts:
             return ClarificationType.MULTIPLE_CHOICE
         
+        overall = confidence.overall_confidence
+        
         # If confidence is very low, ask for input/guidance
-        if confidence.overall_confidence < 0.4:
+        if overall < _INPUT_CONFIDENCE_BELOW:
             return ClarificationType.INPUT
         
         # If confidence is moderate, confirm findings
-        if confidence.overall_confidence < 0.8:
+        if overall < _CONFIRMATION_CONFIDENCE_BELOW:
             return ClarificationType.VALUE_CONFIRMATION
         
         # Default to custom for complex situations
@@ -958,24 +1546,25 @@ class HumanInTheLoopClarificationSystem:
         }
         
         # Generate content based on type
+        preview = f"{claim.content[:100]}..."
         if clarification_type == ClarificationType.MULTIPLE_CHOICE:
             title = "Resolve Evidence Conflicts"
-            description = f"Multiple sources provide conflicting information about: {claim.content[:100]}..."
+            description = f"Multiple sources provide conflicting information about: {preview}"
             options = self._generate_conflict_resolution_options(conflicts, agent_results)
             
         elif clarification_type == ClarificationType.VALUE_CONFIRMATION:
             title = "Confirm Analysis Results"
-            description = f"Please confirm the analysis results for: {claim.content[:100]}..."
+            description = f"Please confirm the analysis results for: {preview}"
             options = None
             
         elif clarification_type == ClarificationType.INPUT:
             title = "Provide Additional Guidance"
-            description = f"The system needs additional guidance for: {claim.content[:100]}..."
+            description = f"The system needs additional guidance for: {preview}"
             options = None
             
         else:  # CUSTOM
             title = "Complex Situation Review"
-            description = f"A complex situation requires human review: {claim.content[:100]}..."
+            description = f"A complex situation requires human review: {preview}"
             options = None
         
         request = ClarificationRequest(
@@ -997,55 +1586,69 @@ class HumanInTheLoopClarificationSystem:
     def _generate_conflict_resolution_options(self, conflicts: List[EvidenceConflict],
                                             agent_results: Dict[str, AgentResult]) -> List[Dict[str, Any]]:
         """Generate options for resolving conflicts"""
-        options = []
-        
-        # Add options based on conflicting sources
-        for conflict in conflicts:
-            if conflict.conflict_type == ConflictType.CONTRADICTORY_SOURCES:
-                for i, source in enumerate(conflict.conflicting_sources):
-                    options.append({
-                        "id": f"source_{conflict.conflict_id}_{i}",
-                        "label": f"Trust {source.get('source', 'Unknown Source')}",
-                        "description": f"Verdict: {source.get('verdict', 'Unknown')} (Confidence: {source.get('confidence', 0):.2f})",
-                        "data": source
-                    })
-        
-        # Add option to request more evidence
-        options.append({
-            "id": "request_more_evidence",
-            "label": "Request Additional Evidence",
-            "description": "Ask for more sources before making a decision",
-            "data": {"action": "request_more_evidence"}
-        })
-        
-        # Add option for manual review
-        options.append({
-            "id": "manual_review",
-            "label": "Escalate for Manual Review",
-            "description": "Flag this claim for detailed manual investigation",
-            "data": {"action": "escalate"}
-        })
+        contradictory = ConflictType.CONTRADICTORY_SOURCES
+        
+        # One option per source behind each contradiction
+        options = [
+            {
+                "id": option_id,
+                "label": f"Trust {source.get('source', 'Unknown Source')}",
+                "description": f"Verdict: {source.get('verdict', 'Unknown')} (Confidence: {source.get('confidence', 0):.2f})",
+                "data": dict(source)
+            }
+            for conflict in conflicts if conflict.conflict_type is contradictory
+            for option_id, source in zip(conflict.option_ids, conflict.conflicting_sources)
+        ]
         
+        # Then the fixed options to request more evidence or escalate
+        for fixed_option in (_REQUEST_MORE_EVIDENCE_OPTION, _MANUAL_REVIEW_OPTION):
+            options.append({**fixed_option, "data": dict(fixed_option["data"])})
         return options
     
     async def _notify_clarification_callbacks(self, request: ClarificationRequest):
-        """Notify registered callbacks about new clarification request"""
+        """
+        Notify registered callbacks about new clarification request
+        
+        Callbacks are called in registration order. Awaitables returned by async
+        callbacks are then awaited together, so their bodies run concurrently once
+        every callback has been called.
+        """
+        pending = []
         for callback in self.clarification_callbacks:
             try:
-                if asyncio.iscoroutinefunction(callback):
-                    await callback(request)
-                else:
-                    callback(request)
+                result = callback(request)
             except Exception as e:
                 self.logger.error(f"Error in clarification callback: {e}", exc_info=True)
+                continue
+            if inspect.isawaitable(result):
+                pending.append(result)
+        
+        if not pending:
+            return
+        if len(pending) == 1:
+            # A lone callback is awaited inline rather than wrapped in a task
+            results = [await _capture_exception(pending[0])]
+        else:
+            # Coroutine callbacks run concurrently, so slow notifiers overlap instead of queueing
+            results = await asyncio.gather(*pending, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                self.logger.error(f"Error in clarification callback: {result}", exc_info=result)
     
     def _start_cleanup_task(self):
         """Start background task for cleaning up expired requests"""
         async def cleanup_task():
+            tracker = self.state_tracker
             while True:
                 try:
-                    self.state_tracker.cleanup_expired_requests()
-                    await asyncio.sleep(300)  # Run every 5 minutes
+                    tracker.cleanup_expired_requests()
+                    # Sleep until the next deadline, or until one is scheduled when nothing is pending
+                    try:
+                        async with asyncio.timeout(tracker.seconds_until_next_expiry()):
+                            await tracker.expiry_scheduled.wait()
+                    except TimeoutError:
+                        pass
+                    tracker.expiry_scheduled.clear()
                 except Exception as e:
                     self.logger.error(f"Error in cleanup task: {e}", exc_info=True)
                     await asyncio.sleep(60)  # Wait before retrying
@@ -16,15 +16,22 @@ Key Features:
 
 import os
 import asyncio
+import copy
 import logging
-import json
+import hashlib
+import threading
+import time
 import uuid
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
-from typing import Dict, Any, List, Optional, Union, Callable, Type
+from typing import AsyncIterator, Dict, Any, List, Optional, Tuple, Union, Callable, Type
 from dataclasses import dataclass, asdict
 from enum import Enum
 import traceback
 
+import orjson
+from cachetools import TTLCache
+
 try:
     from portia import Portia, Config, LLMProvider
     from portia.tool import Tool, ToolRunContext
@@ -63,10 +70,27 @@ except ImportError:
             pass
 
 
+# Optional semantic cache dependencies
+try:
+    import numpy as np
+    import faiss
+    from sentence_transformers import SentenceTransformer
+    SEMANTIC_CACHE_AVAILABLE = True
+except ImportError:
+    SEMANTIC_CACHE_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Bound once for the timestamping on every audit event
+_UTC = timezone.utc
+_now = datetime.now
+
+# Serialized audit trails idle for longer than a workflow's lifetime are dropped
+_SERIALIZED_TRAIL_TTL_SECONDS = 3600
+_MAX_SERIALIZED_TRAILS = 10_000
+
 
 class DetectiveAgentType(Enum):
     """Agent types for the AI Detective system"""
@@ -106,7 +130,7 @@ class AuditEvent:
         return result
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, kw_only=True)
 class ClaimData:
     """Data structure for claims being processed"""
     claim_id: str
@@ -115,9 +139,14 @@ class ClaimData:
     submitter_id: Optional[str] = None
     timestamp: Optional[datetime] = None
     metadata: Optional[Dict[str, Any]] = None
+    
+    @classmethod
+    def from_ns(cls, timestamp_ns: int, **fields) -> 'ClaimData':
+        """Create a claim stamped from an epoch nanosecond count such as time.time_ns()"""
+        return cls(timestamp=datetime.fromtimestamp(timestamp_ns / 1e9, tz=_UTC), **fields)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, kw_only=True)
 class AgentResult:
     """Result from an agent operation"""
     agent_type: DetectiveAgentType
@@ -162,6 +191,12 @@ class PortiaConfig:
         self.timeout_seconds = int(os.getenv("AI_DETECTIVE_TIMEOUT", "300"))
         self.log_level = os.getenv("AI_DETECTIVE_LOG_LEVEL", "INFO")
         
+        # Semantic cache for LLM plan results (requires requirements-optional.txt). Off by default:
+        # a claim and its negation embed almost identically, so one could be served the other's result
+        self.semantic_cache_enabled = os.getenv("AI_DETECTIVE_SEMANTIC_CACHE", "false").lower() == "true"
+        self.semantic_cache_threshold = float(os.getenv("AI_DETECTIVE_SEMANTIC_CACHE_THRESHOLD", "0.92"))
+        self.semantic_cache_model = os.getenv("AI_DETECTIVE_SEMANTIC_CACHE_MODEL", "all-MiniLM-L6-v2")
+        
         # Database Configuration
         self.database_url = os.getenv("DATABASE_URL")
         self.redis_url = os.getenv("REDIS_URL")
@@ -251,14 +286,40 @@ class AuditManager:
     def __init__(self):
         self.events: List[AuditEvent] = []
         self.plan_runs: Dict[str, Any] = {}
+        # Append-only NDJSON copy of each claim's events, serialized once at log time
+        self._serialized_trails: TTLCache = TTLCache(
+            maxsize=_MAX_SERIALIZED_TRAILS, ttl=_SERIALIZED_TRAIL_TTL_SECONDS
+        )
         
     def log_event(self, agent_type: DetectiveAgentType, event_type: str, 
                   claim_id: Optional[str] = None, user_id: Optional[str] = None,
                   data: Optional[Dict[str, Any]] = None, error: Optional[str] = None):
         """Log an audit event"""
+        event = self._record(agent_type, event_type, claim_id, user_id, data, error)
+        logger.info(f"Audit event: {event_type} by {agent_type.value}")
+        
+        return event.event_id
+        
+    def log_events_batch(self, events: List[Dict[str, Any]]) -> List[str]:
+        """
+        Log several audit events at once
+        
+        Each entry holds log_event's keyword arguments, plus an optional
+        timestamp recording when the event actually happened.
+        """
+        event_ids = [self._record(**event).event_id for event in events]
+        if event_ids:
+            logger.info(f"Audit events: {len(event_ids)} logged in batch")
+        return event_ids
+        
+    def _record(self, agent_type: DetectiveAgentType, event_type: str,
+                claim_id: Optional[str] = None, user_id: Optional[str] = None,
+                data: Optional[Dict[str, Any]] = None, error: Optional[str] = None,
+                timestamp: Optional[datetime] = None) -> AuditEvent:
+        """Store an event and append it to its claim's serialized trail"""
         event = AuditEvent(
             event_id=str(uuid.uuid4()),
-            timestamp=datetime.now(timezone.utc),
+            timestamp=timestamp or _now(_UTC),
             agent_type=agent_type,
             event_type=event_type,
             claim_id=claim_id,
@@ -268,21 +329,31 @@ class AuditManager:
         )
         
         self.events.append(event)
-        logger.info(f"Audit event: {event_type} by {agent_type.value}")
-        
-        return event.event_id
+        if claim_id:
+            trail = self._serialized_trails.get(claim_id) or bytearray()
+            trail += orjson.dumps(
+                event.to_dict(), default=str,
+                option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+            )
+            # Reassign so the trail's TTL runs from its latest event
+            self._serialized_trails[claim_id] = trail
+        return event
         
     def track_plan_run(self, plan_run_id: str, plan_run_data: Dict[str, Any]):
         """Track a Portia plan run for audit purposes"""
         self.plan_runs[plan_run_id] = {
             **plan_run_data,
-            "tracked_at": datetime.now(timezone.utc).isoformat()
+            "tracked_at": _now(_UTC).isoformat()
         }
         
     def get_claim_audit_trail(self, claim_id: str) -> List[Dict[str, Any]]:
         """Get complete audit trail for a specific claim"""
         return [event.to_dict() for event in self.events if event.claim_id == claim_id]
         
+    def get_serialized_audit_trail(self, claim_id: str) -> bytes:
+        """Get the audit trail for a specific claim as newline-delimited JSON"""
+        return bytes(self._serialized_trails.get(claim_id, b""))
+        
     def export_audit_data(self, start_date: Optional[datetime] = None,
                          end_date: Optional[datetime] = None) -> Dict[str, Any]:
         """Export audit data for compliance/reporting"""
@@ -294,16 +365,134 @@ class AuditManager:
             filtered_events = [e for e in filtered_events if e.timestamp <= end_date]
             
         return {
-            "export_timestamp": datetime.now(timezone.utc).isoformat(),
+            "export_timestamp": _now(_UTC).isoformat(),
             "event_count": len(filtered_events),
             "events": [event.to_dict() for event in filtered_events],
             "plan_runs": self.plan_runs
         }
 
 
+# Sentence encoders shared by every semantic cache, loaded once per model
+_encoders: Dict[str, 'SentenceTransformer'] = {}
+_encoders_lock = threading.Lock()
+
+
+def _get_encoder(model_name: str) -> 'SentenceTransformer':
+    """Get the shared encoder for a model, loading it on first use"""
+    with _encoders_lock:
+        encoder = _encoders.get(model_name)
+        if encoder is None:
+            encoder = _encoders[model_name] = SentenceTransformer(model_name)
+        return encoder
+
+
+class SemanticCache:
+    """Reuses plan results for claims whose embeddings are near-duplicates of earlier ones
+    
+    Embeddings are L2-normalized so inner-product search in a flat FAISS index
+    gives cosine similarity. Each scope, such as the claim's source URL, has its own
+    index, so only same-scope results are candidates. Disabled when the optional
+    dependencies are missing.
+    """
+    
+    def __init__(self, threshold: float = 0.92, model_name: str = "all-MiniLM-L6-v2",
+                 max_entries: int = 10_000, enabled: bool = True):
+        self.threshold = threshold
+        self.model_name = model_name
+        self.max_entries = max_entries
+        self.enabled = enabled and SEMANTIC_CACHE_AVAILABLE
+        self._by_scope: Dict[str, Tuple['faiss.IndexFlatIP', List[Dict[str, Any]]]] = {}
+        self._entries = 0
+        # Lookups and inserts run in worker threads; an index and its results change together
+        self._lock = threading.Lock()
+        
+    def _embed(self, text: str) -> 'np.ndarray':
+        """Encode text as a normalized float32 row vector"""
+        embedding = _get_encoder(self.model_name).encode([text], normalize_embeddings=True)
+        return np.asarray(embedding, dtype="float32")
+        
+    def _lookup(self, text: str, scope: str) -> Optional[Dict[str, Any]]:
+        if scope not in self._by_scope:
+            # Nothing cached for this scope yet, so skip encoding the text
+            return None
+        embedding = self._embed(text)
+        with self._lock:
+            scoped = self._by_scope.get(scope)
+            if scoped is None:
+                return None
+            index, results = scoped
+            scores, ids = index.search(embedding, 1)
+            if scores[0, 0] < self.threshold:
+                return None
+            result = results[ids[0, 0]]
+        # Callers get their own copy, so mutating a hit cannot corrupt the cache
+        return copy.deepcopy(result)
+        
+    def _insert(self, text: str, scope: str, result: Dict[str, Any]):
+        embedding = self._embed(text)
+        result = copy.deepcopy(result)
+        with self._lock:
+            if self._entries >= self.max_entries:
+                # Start over when full; a flat index does not support eviction
+                self._by_scope = {}
+                self._entries = 0
+            scoped = self._by_scope.get(scope)
+            if scoped is None:
+                scoped = self._by_scope[scope] = (faiss.IndexFlatIP(embedding.shape[1]), [])
+            index, results = scoped
+            index.add(embedding)
+            results.append(result)
+            self._entries += 1
+        
+    async def lookup(self, text: str, scope: str = "") -> Optional[Dict[str, Any]]:
+        """Get a cached result for semantically similar text with the same scope, if any"""
+        if not self.enabled:
+            return None
+        return await asyncio.to_thread(self._lookup, text, scope)
+        
+    async def store(self, text: str, result: Dict[str, Any], scope: str = ""):
+        """Cache a result under the embedding of text"""
+        if self.enabled:
+            await asyncio.to_thread(self._insert, text, scope, result)
+
+
+class MeasuredRegion:
+    """Timing and outcome of one measured agent operation"""
+    
+    __slots__ = ("operation", "start_ns", "error")
+    
+    def __init__(self, operation: str):
+        self.operation = operation
+        self.start_ns = time.perf_counter_ns()
+        self.error: Optional[str] = None
+        
+    @property
+    def elapsed_ms(self) -> int:
+        return (time.perf_counter_ns() - self.start_ns) // 1_000_000
+        
+    def failure(self, agent_type: DetectiveAgentType) -> AgentResult:
+        """Build the failed result for an operation whose error was captured"""
+        return AgentResult(
+            agent_type=agent_type,
+            success=False,
+            error=self.error,
+            execution_time_ms=self.elapsed_ms
+        )
+
+
 class DetectiveAgentBase:
     """Base class for AI Detective agents using Portia SDK"""
     
+    # Batches are dispatched all at once, up to MAX_BATCH_CONCURRENCY claims in flight
+    BATCHING_PREFERENCE = "ALL_AT_ONCE"
+    MAX_BATCH_CONCURRENCY = 8
+    
+    # Exact-match results shared by all agent instances, keyed by agent type and claim content
+    _result_memo: TTLCache = TTLCache(maxsize=10_000, ttl=86400)
+    
+    # Semantic caches shared by all agent instances, one per agent type since their prompts differ
+    _semantic_caches: Dict[DetectiveAgentType, SemanticCache] = {}
+    
     def __init__(self, agent_type: DetectiveAgentType, portia_client: 'PortiaCore',
                  audit_manager: AuditManager):
         self.agent_type = agent_type
@@ -311,26 +500,112 @@ class DetectiveAgentBase:
         self.audit_manager = audit_manager
         self.logger = logging.getLogger(f"detective.{agent_type.value}")
         
+        # Agents are created per workflow, so the cache for their type outlives them
+        self.semantic_cache = self._semantic_caches.get(agent_type)
+        if self.semantic_cache is None:
+            config = portia_client.config
+            self.semantic_cache = self._semantic_caches.setdefault(agent_type, SemanticCache(
+                threshold=config.semantic_cache_threshold,
+                model_name=config.semantic_cache_model,
+                enabled=config.semantic_cache_enabled
+            ))
+        
     async def process_claim(self, claim: ClaimData, **kwargs) -> AgentResult:
         """Process a claim - to be implemented by subclasses"""
         raise NotImplementedError("Subclasses must implement process_claim method")
         
-    def _log_start(self, claim_id: str, operation: str):
-        """Log agent operation start"""
+    async def process_claims_batch(self, claims: List[ClaimData], **kwargs) -> List[AgentResult]:
+        """Process several claims concurrently, returning results in input order"""
+        semaphore = asyncio.Semaphore(self.MAX_BATCH_CONCURRENCY)
+        
+        async def process(claim: ClaimData) -> AgentResult:
+            async with semaphore:
+                return await self.process_claim(claim, **kwargs)
+                
+        return await asyncio.gather(*(process(claim) for claim in claims))
+        
+    def _memo_key(self, claim: ClaimData) -> str:
+        # Encoded as a JSON array so field boundaries cannot shift between content and URL
+        return hashlib.sha256(
+            orjson.dumps((self.agent_type.value, claim.content, claim.source_url))
+        ).hexdigest()
+        
+    def _memoized_result(self, claim: ClaimData, operation: str) -> Optional[AgentResult]:
+        """Get the stored result for identical claim content, if any, auditing it as a cached operation"""
+        entry = self._result_memo.get(self._memo_key(claim))
+        if entry is None:
+            return None
+        data, confidence = entry
+        self.logger.info(f"Reusing memoized result for claim {claim.claim_id}")
+        result = AgentResult(
+            agent_type=self.agent_type,
+            success=True,
+            # A copy, so callers editing their result cannot change later hits
+            data=copy.deepcopy(data),
+            confidence=confidence,
+            execution_time_ms=0
+        )
+        # Memoized runs still belong in the claim's audit trail
+        self._log_start(claim.claim_id, operation, cached=True)
+        self._log_success(claim.claim_id, operation, result.data, cached=True)
+        return result
+        
+    def _memoize(self, claim: ClaimData, result: AgentResult):
+        """Store a successful result for later identical claims"""
+        if result.success:
+            self._result_memo[self._memo_key(claim)] = (copy.deepcopy(result.data), result.confidence)
+        
+    async def _run_plan(self, claim: ClaimData, query: str, end_user: str) -> Dict[str, Any]:
+        """Run a Portia plan for a claim, reusing the result of a semantically similar claim"""
+        # Prompts include the source URL, so results are only reused for the same source
+        scope = claim.source_url or ""
+        cached = await self.semantic_cache.lookup(claim.content, scope)
+        if cached is not None:
+            self.logger.info(f"Semantic cache hit for claim {claim.claim_id}")
+            return cached
+            
+        plan_result = await self.portia.run_portia_plan(query=query, end_user=end_user)
+        await self.semantic_cache.store(claim.content, plan_result, scope)
+        return plan_result
+        
+    @asynccontextmanager
+    async def measured(self, claim_id: str, operation: str) -> AsyncIterator[MeasuredRegion]:
+        """
+        Time an operation, logging its start and any error
+        
+        Errors are logged and suppressed; code after the block returns region.failure().
+        """
+        region = MeasuredRegion(operation)
+        self._log_start(claim_id, operation)
+        try:
+            yield region
+        except Exception as e:
+            region.error = f"{operation.replace('_', ' ').capitalize()} failed: {str(e)}"
+            self.logger.error(region.error, exc_info=True)
+            self._log_error(claim_id, operation, region.error)
+            
+    def _log_start(self, claim_id: str, operation: str, cached: bool = False):
+        """Log agent operation start, marked as cached when served from the memo"""
+        data = {"operation": operation}
+        if cached:
+            data["cached"] = True
         self.audit_manager.log_event(
             agent_type=self.agent_type,
             event_type=f"{operation}_started",
             claim_id=claim_id,
-            data={"operation": operation}
+            data=data
         )
         
-    def _log_success(self, claim_id: str, operation: str, result_data: Dict[str, Any]):
-        """Log successful agent operation"""
+    def _log_success(self, claim_id: str, operation: str, result_data: Dict[str, Any], cached: bool = False):
+        """Log successful agent operation, marked as cached when served from the memo"""
+        data = {"operation": operation, "result": result_data}
+        if cached:
+            data["cached"] = True
         self.audit_manager.log_event(
             agent_type=self.agent_type,
             event_type=f"{operation}_completed",
             claim_id=claim_id,
-            data={"operation": operation, "result": result_data}
+            data=data
         )
         
     def _log_error(self, claim_id: str, operation: str, error: str):
@@ -409,7 +684,7 @@ class PortiaCore:
         Execute the full claim processing workflow using multiple agents
         """
         workflow_id = str(uuid.uuid4())
-        start_time = datetime.now(timezone.utc)
+        start_time = _now(_UTC)
         
         # Log workflow start
         self.audit_manager.log_event(
@@ -433,26 +708,33 @@ class PortiaCore:
                                DetectiveAgentType.EVIDENCE_COLLECTOR,
                                DetectiveAgentType.REPORT_GENERATOR]
             
-            # Execute agents in sequence (could be made parallel)
-            for agent_type in agents_to_run:
-                if agent_type not in self.agents:
-                    error_msg = f"Agent {agent_type.value} not registered"
+            # Independent agents run concurrently; the report generator waits for their output
+            upstream_agents = [a for a in agents_to_run if a != DetectiveAgentType.REPORT_GENERATOR]
+            outcomes = await asyncio.gather(
+                *(self._run_agent(agent_type, claim) for agent_type in upstream_agents)
+            )
+            for agent_type, (agent_result, error_msg) in zip(upstream_agents, outcomes):
+                if error_msg:
                     errors.append(error_msg)
-                    self.logger.warning(error_msg)
-                    continue
+                else:
+                    results[agent_type.value] = agent_result
                     
-                try:
-                    self.logger.info(f"Processing claim {claim.claim_id} with {agent_type.value}")
-                    agent_result = await self.agents[agent_type].process_claim(claim)
-                    results[agent_type.value] = asdict(agent_result)
-                    
-                except Exception as e:
-                    error_msg = f"Agent {agent_type.value} failed: {str(e)}"
+            if DetectiveAgentType.REPORT_GENERATOR in agents_to_run:
+                parsed = results.get(DetectiveAgentType.CLAIM_PARSER.value)
+                evidence = results.get(DetectiveAgentType.EVIDENCE_COLLECTOR.value)
+                agent_result, error_msg = await self._run_agent(
+                    DetectiveAgentType.REPORT_GENERATOR, claim,
+                    parsed_data=parsed["data"] if parsed else None,
+                    evidence_data=evidence["data"] if evidence else None
+                )
+                if error_msg:
                     errors.append(error_msg)
-                    self.logger.error(error_msg, exc_info=True)
+                else:
+                    results[DetectiveAgentType.REPORT_GENERATOR.value] = agent_result
                     
             # Calculate overall workflow result
-            execution_time = (datetime.now(timezone.utc) - start_time).total_seconds()
+            finished_at = _now(_UTC)
+            execution_time = (finished_at - start_time).total_seconds()
             success = len(errors) == 0
             
             workflow_result = {
@@ -462,7 +744,7 @@ class PortiaCore:
                 "execution_time_seconds": execution_time,
                 "agent_results": results,
                 "errors": errors,
-                "timestamp": datetime.now(timezone.utc).isoformat()
+                "timestamp": finished_at.isoformat()
             }
             
             # Log workflow completion
@@ -492,6 +774,24 @@ class PortiaCore:
             
             raise
             
+    async def _run_agent(self, agent_type: DetectiveAgentType, claim: ClaimData,
+                         **kwargs) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """Run one registered agent, returning its result dict or an error message"""
+        if agent_type not in self.agents:
+            error_msg = f"Agent {agent_type.value} not registered"
+            self.logger.warning(error_msg)
+            return None, error_msg
+            
+        try:
+            self.logger.info(f"Processing claim {claim.claim_id} with {agent_type.value}")
+            agent_result = await self.agents[agent_type].process_claim(claim, **kwargs)
+            return asdict(agent_result), None
+            
+        except Exception as e:
+            error_msg = f"Agent {agent_type.value} failed: {str(e)}"
+            self.logger.error(error_msg, exc_info=True)
+            return None, error_msg
+            
     async def run_portia_plan(self, query: str, end_user: Optional[str] = None,
                             structured_output_schema: Optional[Type[BaseModel]] = None,
                             timeout_seconds: Optional[int] = None) -> Dict[str, Any]:
@@ -560,6 +860,17 @@ class PortiaCore:
             
             raise
             
+    async def stream_portia_plan(self, query: str, end_user: Optional[str] = None) -> AsyncIterator[str]:
+        """
+        Yield plan output through run_portia_plan, with the same tracking and audit
+        
+        The Portia client has no streaming API yet, so the output arrives as a single
+        chunk once the plan completes; callers already consume it incrementally.
+        """
+        result = await self.run_portia_plan(query=query, end_user=end_user)
+        if result.get("final_output") is not None:
+            yield str(result["final_output"])
+            
     def get_plan_run_state(self, plan_run_id: str) -> Optional[Dict[str, Any]]:
         """Get current state of a plan run"""
         return self.audit_manager.plan_runs.get(plan_run_id)
@@ -573,7 +884,7 @@ class PortiaCore:
     async def health_check(self) -> Dict[str, Any]:
         """System health check"""
         health_status = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": _now(_UTC).isoformat(),
             "portia_sdk_available": PORTIA_AVAILABLE,
             "portia_client_initialized": self.portia_client is not None,
             "registered_agents": len(self.agents),
@@ -714,7 +1025,7 @@ async def quick_claim_verification(claim_text: str, source_url: Optional[str] =
         claim_id=str(uuid.uuid4()),
         content=claim_text,
         source_url=source_url,
-        timestamp=datetime.now(timezone.utc)
+        timestamp=_now(_UTC)
     )
     
     try:
@@ -728,7 +1039,7 @@ async def quick_claim_verification(claim_text: str, source_url: Optional[str] =
         return {
             "claim_id": claim.claim_id,
             "verification_result": result,
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": _now(_UTC).isoformat()
         }
         
     except Exception as e:
@@ -736,7 +1047,7 @@ async def quick_claim_verification(claim_text: str, source_url: Optional[str] =
         return {
             "claim_id": claim.claim_id,
             "error": str(e),
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": _now(_UTC).isoformat()
         }
 
 
@@ -752,14 +1063,14 @@ if __name__ == "__main__":
             
             # Run health check
             health = await core.health_check()
-            print("Health Check:", json.dumps(health, indent=2))
+            print("Health Check:", orjson.dumps(health, default=str, option=orjson.OPT_INDENT_2).decode())
             
             # Test quick verification
             result = await quick_claim_verification(
                 "The Earth is round",
                 "https://example.com/earth-shape"
             )
-            print("Quick Verification:", json.dumps(result, indent=2))
+            print("Quick Verification:", orjson.dumps(result, default=str, option=orjson.OPT_INDENT_2).decode())
             
         except Exception as e:
             print(f"Error: {e}")
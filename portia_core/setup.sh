@@ -32,7 +32,7 @@ print_error() {
     echo -e "${RED}[ERROR]${NC} $1"
 }
 
-# Check if Python 3.8+ is available
+# Check if Python 3.11+ is available
 check_python() {
     print_status "Checking Python version..."
     
@@ -41,15 +41,15 @@ check_python() {
         PYTHON_MAJOR=$(echo $PYTHON_VERSION | cut -d. -f1)
         PYTHON_MINOR=$(echo $PYTHON_VERSION | cut -d. -f2)
         
-        if [ "$PYTHON_MAJOR" -eq 3 ] && [ "$PYTHON_MINOR" -ge 8 ]; then
+        if [ "$PYTHON_MAJOR" -eq 3 ] && [ "$PYTHON_MINOR" -ge 11 ]; then
             print_success "Python $PYTHON_VERSION found"
             PYTHON_CMD="python3"
         else
-            print_error "Python 3.8+ required. Found Python $PYTHON_VERSION"
+            print_error "Python 3.11+ required. Found Python $PYTHON_VERSION"
             exit 1
         fi
     else
-        print_error "Python 3 not found. Please install Python 3.8 or later."
+        print_error "Python 3 not found. Please install Python 3.11 or later."
         exit 1
     fi
 }
@@ -56,6 +56,17 @@ from portia_core import (
 logger = logging.getLogger(__name__)
 
 
+def create_http_session(max_connections: int = 200, max_per_host: int = 10) -> aiohttp.ClientSession:
+    """Create the pooled HTTP session shared by all retrieval components"""
+    return aiohttp.ClientSession(
+        timeout=aiohttp.ClientTimeout(total=30),
+        headers={
+            'User-Agent': 'Mozilla/5.0 (Portia AI Detective Bot) Web Content Analyzer'
+        },
+        connector=aiohttp.TCPConnector(limit=max_connections, limit_per_host=max_per_host)
+    )
+
+
 class SourceType(Enum):
     """Types of sources for content reliability scoring"""
     NEWS_OUTLET = "news_outlet"
@@ -262,13 +273,17 @@ class SourceClassifier:
 class ContentExtractor:
     """Extracts and processes content from web pages"""
     
-    def __init__(self):
-        self.session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=30),
-            headers={
-                'User-Agent': 'Mozilla/5.0 (Portia AI Detective Bot) Web Content Analyzer'
-            }
-        )
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
+        # A shared session keeps connections alive across crawls; otherwise one is created on first use
+        self.session = session
+        self._owns_session = session is None
+        
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the HTTP session, creating an owned one if none was provided"""
+        if self.session is None or self.session.closed:
+            self.session = create_http_session()
+            self._owns_session = True
+        return self.session
         
     async def extract_content(self, url: str, method: str = 'auto') -> Optional[Dict[str, Any]]:
         """Extract content using specified method"""
@@ -285,7 +300,7 @@ class ContentExtractor:
     async def _extract_with_requests(self, url: str) -> Optional[Dict[str, Any]]:
         """Extract using simple HTTP requests"""
         try:
-            async with self.session.get(url) as response:
+            async with self._get_session().get(url) as response:
                 if response.status == 200:
                     content = await response.text()
                     soup = BeautifulSoup(content, 'html.parser')
@@ -359,8 +374,9 @@ class ContentExtractor:
         return await self._extract_with_browser(url)
         
     async def close(self):
-        """Close the HTTP session"""
-        await self.session.close()
+        """Close the HTTP session if this extractor created it"""
+        if self._owns_session and self.session is not None:
+            await self.session.close()
 
 
 class WebSearchOrchestrator:
@@ -497,12 +513,12 @@ class WebSearchOrchestrator:
 class GraphCrawler:
     """Implements graph-based web crawling for evidence collection"""
     
-    def __init__(self, max_concurrent: int = 10):
+    def __init__(self, max_concurrent: int = 10, session: Optional[aiohttp.ClientSession] = None):
         self.max_concurrent = max_concurrent
         self.visited_urls = set()
         self.url_graph = defaultdict(set)  # url -> set of linked urls
         self.semaphore = asyncio.Semaphore(max_concurrent)
-        self.content_extractor = ContentExtractor()
+        self.content_extractor = ContentExtractor(session)
         
     async def crawl_graph(self, seed_urls: List[str], search_terms: List[str],
                          max_depth: int = 2, max_pages: int = 100) -> List[WebSource]:
@@ -533,9 +549,12 @@ class GraphCrawler:
                 if isinstance(result, WebSource):
                     sources.append(result)
                     
-        await self.content_extractor.close()
         return sources
         
+    async def close(self):
+        """Release the crawler's HTTP resources"""
+        await self.content_extractor.close()
+        
     async def _crawl_url(self, url: str, depth: int, search_terms: List[str],
                         max_depth: int, crawl_queue: deque) -> Optional[WebSource]:
         """Crawl a single URL"""
@@ -742,12 +761,17 @@ class EvidenceValidator:
 class WebRetrievalPipeline(DetectiveAgentBase):
     """Main web retrieval pipeline orchestrating all components"""
     
-    def __init__(self, portia_client: PortiaCore, audit_manager: AuditManager):
+    def __init__(self, portia_client: PortiaCore, audit_manager: AuditManager,
+                 session: Optional[aiohttp.ClientSession] = None):
         super().__init__(DetectiveAgentType.EVIDENCE_COLLECTOR, portia_client, audit_manager)
         
+        # All HTTP traffic goes through one pooled session for connection reuse
+        self.session = session
+        self._owns_session = session is None
+        
         # Initialize components
         self.search_orchestrator = WebSearchOrchestrator()
-        self.graph_crawler = GraphCrawler(max_concurrent=5)
+        self.graph_crawler = GraphCrawler(max_concurrent=5, session=session)
         self.evidence_validator = EvidenceValidator()
         self.source_classifier = SourceClassifier()
         
@@ -986,24 +1010,33 @@ class WebRetrievalPipeline(DetectiveAgentBase):
     )
     async def _robust_http_request(self, url: str, method: str = 'GET', **kwargs) -> Dict[str, Any]:
         """Make HTTP requests with robust error handling and retry logic"""
-        async with aiohttp.ClientSession() as session:
-            async with session.request(method, url, **kwargs) as response:
-                return {
-                    'status': response.status,
-                    'content': await response.text(),
-                    'headers': dict(response.headers)
-                }
+        if self.session is None or self.session.closed:
+            self.session = create_http_session()
+            self._owns_session = True
+        async with self.session.request(method, url, **kwargs) as response:
+            return {
+                'status': response.status,
+                'content': await response.text(),
+                'headers': dict(response.headers)
+            }
+    
+    async def close(self):
+        """Release HTTP resources created by the pipeline"""
+        await self.graph_crawler.close()
+        if self._owns_session and self.session is not None:
+            await self.session.close()
 
 
 # Factory functions for easy initialization
-def create_web_retrieval_pipeline(portia_core: PortiaCore = None) -> WebRetrievalPipeline:
+def create_web_retrieval_pipeline(portia_core: PortiaCore = None,
+                                  session: Optional[aiohttp.ClientSession] = None) -> WebRetrievalPipeline:
     """Factory function to create a web retrieval pipeline"""
     if portia_core is None:
         from portia_core import PortiaCore, PortiaConfig
         config = PortiaConfig()
         portia_core = PortiaCore(config)
         
-    pipeline = WebRetrievalPipeline(portia_core, portia_core.audit_manager)
+    pipeline = WebRetrievalPipeline(portia_core, portia_core.audit_manager, session=session)
     portia_core.register_agent(pipeline)
     
     return pipeline
@@ -1022,7 +1055,10 @@ async def quick_web_evidence_collection(claim_text: str, max_sources: int = 20)
     )
     
     # Process claim
-    result = await pipeline.process_claim(claim, max_sources=max_sources)
+    try:
+        result = await pipeline.process_claim(claim, max_sources=max_sources)
+    finally:
+        await pipeline.close()
     
     return {
         'success': result.success,